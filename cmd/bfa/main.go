@@ -69,7 +69,13 @@ func main() {
 	cb := resilience.NewCircuitBreaker("external-apis")
 
 	/* Clients */
-	httpClient := &http.Client{Timeout: cfg.HTTPTimeout}
+	// Pool de keep-alive dimensionado para o fan-out ao Supabase (ver chat.NewClient).
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 2 * cfg.MaxConcurrency
+	transport.MaxIdleConnsPerHost = cfg.MaxConcurrency
+	transport.IdleConnTimeout = 90 * time.Second
+	transport.ForceAttemptHTTP2 = true
+	httpClient := &http.Client{Timeout: cfg.HTTPTimeout, Transport: transport}
 
 	var profileClient mainport.ProfileFetcher
 	var transactionsClient mainport.TransactionsFetcher
@@ -128,6 +134,17 @@ func main() {
 	/* Chat (onboarding orquestrado pelo BFA) */
 	chatClient := chat.NewClient(cfg.ChatAgentURL, 30*time.Second, cfg.ChatMaxRetries, cfg.ChatRetryDelay, logger)
 	chatSessions := chat.NewSessionStore()
+
+	// Aquece a conexão com o agente em background — não bloqueia o startup
+	go func() {
+		warmCtx, warmCancel := context.WithTimeout(context.Background(), 30*time.Second)
+		defer warmCancel()
+		chatClient.Warmup(warmCtx)
+	}()
+	var chatCtxCache mainport.Cache[*chat.FinancialContext]
+	if cfg.ChatContextTTL > 0 {
+		chatCtxCache = cache.New[*chat.FinancialContext](cfg.ChatContextTTL)
+	}
 	var chatRepo chat.AccountRepository
 	var chatTranscripts chat.TranscriptRepository
 	var chatEvaluations chat.EvaluationRepository
@@ -149,10 +166,15 @@ func main() {
 		chatMetrics = chat.NewInMemoryMetricsRepository(logger)
 		logger.Warn("chat using in-memory repository (Supabase not configured)")
 	}
-	chatSvc := chat.NewService(chatClient, chatSessions, chatRepo, chatTranscripts, chatEvaluations, chatCtxFetcher, chatAuthStore, cfg.ChatHistoryAnonymousOnly, logger)
+	if cfg.ChatMetricsTTL > 0 {
+		chatMetrics = chat.NewCachedMetricsRepository(chatMetrics, cache.New[*chat.ChatMetricsResponse](cfg.ChatMetricsTTL))
+	}
+	chatSvc := chat.NewService(chatClient, chatSessions, chatRepo, chatTranscripts, chatEvaluations, chatCtxFetcher, chatAuthStore, chatCtxCache, cfg.ChatHistoryAnonymousOnly, logger)
 	logger.Info("chat service enabled",
 		zap.String("agent_url", cfg.ChatAgentURL),
 		zap.Bool("history_anonymous_only", cfg.ChatHistoryAnonymousOnly),
+		zap.Duration("context_cache_ttl", cfg.ChatContextTTL),
+		zap.Duration("metrics_cache_ttl", cfg.ChatMetricsTTL),
 	)
 
 	/* Router */
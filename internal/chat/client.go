@@ -22,8 +22,17 @@ type Client struct {
 }
 
 func NewClient(baseURL string, timeout time.Duration, maxRetries int, retryDelay time.Duration, logger *zap.Logger) *Client {
+	// Transport próprio: o DefaultTransport mantém só 2 conexões ociosas por host,
+	// então com turnos concorrentes as conexões excedentes eram fechadas e cada
+	// chamada seguinte pagava um novo handshake TCP+TLS com o agente.
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 50
+	transport.IdleConnTimeout = 90 * time.Second
+	transport.ForceAttemptHTTP2 = true
+
 	return &Client{
-		httpClient: &http.Client{Timeout: timeout},
+		httpClient: &http.Client{Timeout: timeout, Transport: transport},
 		baseURL:    baseURL,
 		maxRetries: maxRetries,
 		retryDelay: retryDelay,
@@ -48,8 +57,13 @@ func (c *Client) Send(ctx context.Context, req AgentRequest) (*AgentResponse, er
 		zap.Int("history_len", len(req.History)),
 		zap.String("validation_error", req.ValidationError),
 		zap.Bool("has_financial_context", req.FinancialContext != nil),
-		zap.String("request_body", string(body)),
+		zap.Int("request_bytes", len(body)),
 	)
+	// Body completo só em Debug — Check evita copiar o payload (que inclui o
+	// contexto financeiro inteiro) para string quando o nível está desligado.
+	if ce := c.logger.Check(zap.DebugLevel, "➡️  request body enviado ao agente"); ce != nil {
+		ce.Write(zap.ByteString("request_body", body))
+	}
 
 	var lastErr error
 	attempts := 1 + c.maxRetries // 1 tentativa original + N retries
@@ -89,21 +103,23 @@ func (c *Client) Send(ctx context.Context, req AgentRequest) (*AgentResponse, er
 			)
 			continue // retry
 		}
-		defer resp.Body.Close()
 
+		// Lê e fecha já dentro da iteração (não com defer): assim a conexão
+		// volta ao pool antes do retry em vez de ficar presa até o return.
 		rawBody, err := io.ReadAll(resp.Body)
+		resp.Body.Close()
 		if err != nil {
 			lastErr = fmt.Errorf("read body: %w", err)
 			continue // retry
 		}
 
 		if resp.StatusCode >= 500 {
-			lastErr = fmt.Errorf("status %d: %s", resp.StatusCode, string(rawBody))
+			lastErr = fmt.Errorf("status %d: %s", resp.StatusCode, rawBody)
 			c.logger.Warn("⚠️  agente Python retornou erro 5xx (retentável)",
 				zap.Int("attempt", attempt),
 				zap.Int("status", resp.StatusCode),
 				zap.Duration("latency", latency),
-				zap.String("body", string(rawBody)),
+				zap.ByteString("body", rawBody),
 			)
 			continue // retry on 5xx
 		}
@@ -112,9 +128,9 @@ func (c *Client) Send(ctx context.Context, req AgentRequest) (*AgentResponse, er
 			c.logger.Warn("⚠️  agente Python retornou erro",
 				zap.Int("status", resp.StatusCode),
 				zap.Duration("latency", latency),
-				zap.String("body", string(rawBody)),
+				zap.ByteString("body", rawBody),
 			)
-			return nil, fmt.Errorf("agent client: status %d: %s", resp.StatusCode, string(rawBody))
+			return nil, fmt.Errorf("agent client: status %d: %s", resp.StatusCode, rawBody)
 		}
 
 		var agentResp AgentResponse
@@ -131,8 +147,11 @@ func (c *Client) Send(ctx context.Context, req AgentRequest) (*AgentResponse, er
 
 		c.logger.Info("⬅️  response recebida do agente Python",
 			zap.Duration("latency", latency),
-			zap.String("raw_body", string(rawBody)),
+			zap.Int("response_bytes", len(rawBody)),
 		)
+		if ce := c.logger.Check(zap.DebugLevel, "⬅️  response body do agente"); ce != nil {
+			ce.Write(zap.ByteString("raw_body", rawBody))
+		}
 
 		return &agentResp, nil
 	}
@@ -140,6 +159,40 @@ func (c *Client) Send(ctx context.Context, req AgentRequest) (*AgentResponse, er
 	return nil, fmt.Errorf("agent client: request failed after %d attempts: %w", attempts, lastErr)
 }
 
+// Warmup faz uma chamada leve ao agente (GET /health) no startup para que o
+// primeiro cliente não pague DNS + TCP + TLS nem o cold start do container do
+// agente. O status da resposta é irrelevante: qualquer resposta já deixa a
+// conexão aberta no pool do httpClient. Erros são apenas logados.
+func (c *Client) Warmup(ctx context.Context) {
+	url := c.baseURL + "/health"
+
+	httpReq, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
+	if err != nil {
+		c.logger.Warn("warmup do agente: request inválida", zap.Error(err))
+		return
+	}
+
+	start := time.Now()
+	resp, err := c.httpClient.Do(httpReq)
+	if err != nil {
+		c.logger.Warn("🔥 warmup do agente falhou",
+			zap.String("url", url),
+			zap.Duration("latency", time.Since(start)),
+			zap.Error(err),
+		)
+		return
+	}
+	// Drenar o body para a conexão voltar ao pool (keep-alive)
+	io.Copy(io.Discard, resp.Body)
+	resp.Body.Close()
+
+	c.logger.Info("🔥 warmup do agente concluído",
+		zap.String("url", url),
+		zap.Int("status", resp.StatusCode),
+		zap.Duration("latency", time.Since(start)),
+	)
+}
+
 func truncateStr(s string, max int) string {
 	if len(s) <= max {
 		return s
@@ -163,22 +216,25 @@ func (c *Client) Evaluate(ctx context.Context, req EvaluateRequest) (*EvaluateRe
 		zap.String("customer_id", req.CustomerID),
 		zap.Int("conversation_turns", len(req.Conversation)),
 	)
-	for i, turn := range req.Conversation {
-		c.logger.Debug("📊 evaluate request — turno",
-			zap.Int("turn", i+1),
-			zap.String("query", truncateStr(turn.Query, 200)),
-			zap.String("answer", truncateStr(turn.Answer, 200)),
-			zap.String("step", turn.Step),
-			zap.String("intent", turn.Intent),
-			zap.Float64("confidence", turn.Confidence),
-			zap.Int64("latency_ms", turn.LatencyMs),
-			zap.Int("rag_contexts", len(turn.Contexts)),
-			zap.String("created_at", turn.CreatedAt),
-		)
+	debug := c.logger.Core().Enabled(zap.DebugLevel)
+	if debug {
+		for i, turn := range req.Conversation {
+			c.logger.Debug("📊 evaluate request — turno",
+				zap.Int("turn", i+1),
+				zap.String("query", truncateStr(turn.Query, 200)),
+				zap.String("answer", truncateStr(turn.Answer, 200)),
+				zap.String("step", turn.Step),
+				zap.String("intent", turn.Intent),
+				zap.Float64("confidence", turn.Confidence),
+				zap.Int64("latency_ms", turn.LatencyMs),
+				zap.Int("rag_contexts", len(turn.Contexts)),
+				zap.String("created_at", turn.CreatedAt),
+			)
+		}
+	}
+	if ce := c.logger.Check(zap.DebugLevel, "📊 evaluate request — body completo"); ce != nil {
+		ce.Write(zap.ByteString("body", body))
 	}
-	c.logger.Debug("📊 evaluate request — body completo",
-		zap.String("body", string(body)),
-	)
 
 	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(body))
 	if err != nil {
@@ -223,23 +279,25 @@ func (c *Client) Evaluate(ctx context.Context, req EvaluateRequest) (*EvaluateRe
 		zap.Int("improvements_count", len(evalResp.Improvements)),
 		zap.String("summary", truncateStr(evalResp.Summary, 300)),
 	)
-	for _, crit := range evalResp.Criteria {
-		c.logger.Debug("📊 evaluate response — critério",
-			zap.String("criterion", crit.Criterion),
-			zap.Float64("score", crit.Score),
-			zap.Float64("max_score", crit.MaxScore),
-			zap.String("reasoning", truncateStr(crit.Reasoning, 200)),
-		)
+	if debug {
+		for _, crit := range evalResp.Criteria {
+			c.logger.Debug("📊 evaluate response — critério",
+				zap.String("criterion", crit.Criterion),
+				zap.Float64("score", crit.Score),
+				zap.Float64("max_score", crit.MaxScore),
+				zap.String("reasoning", truncateStr(crit.Reasoning, 200)),
+			)
+		}
+		for i, imp := range evalResp.Improvements {
+			c.logger.Debug("📊 evaluate response — melhoria",
+				zap.Int("index", i+1),
+				zap.String("suggestion", imp),
+			)
+		}
 	}
-	for i, imp := range evalResp.Improvements {
-		c.logger.Debug("📊 evaluate response — melhoria",
-			zap.Int("index", i+1),
-			zap.String("suggestion", imp),
-		)
+	if ce := c.logger.Check(zap.DebugLevel, "📊 evaluate response — body completo"); ce != nil {
+		ce.Write(zap.ByteString("body", rawBody))
 	}
-	c.logger.Debug("📊 evaluate response — body completo",
-		zap.String("body", string(rawBody)),
-	)
 
 	return &evalResp, nil
 }
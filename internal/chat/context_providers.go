@@ -3,6 +3,7 @@ package chat
 import (
 	"context"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/port"
@@ -21,6 +22,9 @@ import (
 
 const contextTimeout = 15 * time.Second
 
+// recentTransactionsLimit é quantas transações do extrato vão no contexto do agente.
+const recentTransactionsLimit = 30
+
 // ContextFetcher abstrai o acesso aos dados financeiros.
 // Em produção é satisfeito pelo BankingStore (supabaseClient).
 type ContextFetcher interface {
@@ -39,8 +43,39 @@ type ContextFetcher interface {
 // Cada chamada é feita de forma independente; erros isolados são logados
 // mas não impedem os demais contextos de serem preenchidos.
 func BuildFinancialContext(ctx context.Context, store ContextFetcher, authStore port.AuthStore, customerID string, logger *zap.Logger) *FinancialContext {
-	all := []string{"account", "cards", "pix", "billing", "profile", "analytics", "transactions"}
-	return BuildSelectiveContext(ctx, store, authStore, customerID, all, logger)
+	return BuildSelectiveContext(ctx, store, authStore, customerID, allContextKeys, logger)
+}
+
+// allContextKeys — tabela única dos sub-contextos, alocada uma vez só.
+var allContextKeys = []string{"account", "cards", "pix", "billing", "profile", "analytics", "transactions"}
+
+// contextSet marca quais sub-contextos foram pedidos. Conjunto fixo e pequeno:
+// campos bool em vez de um map montado (e hasheado) a cada chamada.
+type contextSet struct {
+	account, cards, pix, billing, profile, analytics, transactions bool
+}
+
+func newContextSet(keys []string) contextSet {
+	var set contextSet
+	for _, k := range keys {
+		switch k {
+		case "account":
+			set.account = true
+		case "cards":
+			set.cards = true
+		case "pix":
+			set.pix = true
+		case "billing":
+			set.billing = true
+		case "profile":
+			set.profile = true
+		case "analytics":
+			set.analytics = true
+		case "transactions":
+			set.transactions = true
+		}
+	}
+	return set
 }
 
 // BuildSelectiveContext busca os sub-contextos listados em requiredContexts em PARALELO.
@@ -60,22 +95,19 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		ContextKeys: []string{},
 	}
 
-	// Montar set para lookup O(1)
-	need := make(map[string]bool, len(requiredContexts))
-	for _, k := range requiredContexts {
-		need[k] = true
-	}
+	need := newContextSet(requiredContexts)
 
 	var mu sync.Mutex // protege fc
 	var wg sync.WaitGroup
+	var failed atomic.Bool // algum provider falhou (snapshot parcial)
 
-	if need["account"] {
+	if need.account {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if acc := fetchAccountContext(pCtx, store, customerID, logger); acc != nil {
+			if acc := fetchAccountContext(pCtx, store, customerID, logger, &failed); acc != nil {
 				mu.Lock()
 				fc.Account = acc
 				fc.ContextKeys = append(fc.ContextKeys, "account")
@@ -84,13 +116,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["cards"] {
+	if need.cards {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if cards := fetchCardsContext(pCtx, store, customerID, logger); cards != nil {
+			if cards := fetchCardsContext(pCtx, store, customerID, logger, &failed); cards != nil {
 				mu.Lock()
 				fc.Cards = cards
 				fc.ContextKeys = append(fc.ContextKeys, "cards")
@@ -99,13 +131,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["pix"] {
+	if need.pix {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if pix := fetchPixContext(pCtx, store, customerID, logger); pix != nil {
+			if pix := fetchPixContext(pCtx, store, customerID, logger, &failed); pix != nil {
 				mu.Lock()
 				fc.Pix = pix
 				fc.ContextKeys = append(fc.ContextKeys, "pix")
@@ -114,13 +146,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["billing"] {
+	if need.billing {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if billing := fetchBillingContext(pCtx, store, customerID, logger); billing != nil {
+			if billing := fetchBillingContext(pCtx, store, customerID, logger, &failed); billing != nil {
 				mu.Lock()
 				fc.Billing = billing
 				fc.ContextKeys = append(fc.ContextKeys, "billing")
@@ -129,13 +161,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["profile"] {
+	if need.profile {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if profile := fetchProfileContext(pCtx, authStore, customerID, logger); profile != nil {
+			if profile := fetchProfileContext(pCtx, authStore, customerID, logger, &failed); profile != nil {
 				mu.Lock()
 				fc.Profile = profile
 				fc.ContextKeys = append(fc.ContextKeys, "profile")
@@ -144,13 +176,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["analytics"] {
+	if need.analytics {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if analytics := fetchAnalyticsContext(pCtx, store, customerID, logger); analytics != nil {
+			if analytics := fetchAnalyticsContext(pCtx, store, customerID, logger, &failed); analytics != nil {
 				mu.Lock()
 				fc.Analytics = analytics
 				fc.ContextKeys = append(fc.ContextKeys, "analytics")
@@ -159,13 +191,13 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 		}()
 	}
 
-	if need["transactions"] {
+	if need.transactions {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
 			pCtx, pCancel := context.WithTimeout(ctx, contextTimeout)
 			defer pCancel()
-			if txns := fetchTransactionsContext(pCtx, store, customerID, logger); txns != nil {
+			if txns := fetchTransactionsContext(pCtx, store, customerID, logger, &failed); txns != nil {
 				mu.Lock()
 				fc.Transactions = txns
 				fc.ContextKeys = append(fc.ContextKeys, "transactions")
@@ -175,6 +207,7 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 	}
 
 	wg.Wait()
+	fc.partial = failed.Load()
 
 	if len(fc.ContextKeys) == 0 {
 		logger.Warn("financial context: nenhum sub-contexto preenchido",
@@ -194,9 +227,10 @@ func BuildSelectiveContext(ctx context.Context, store ContextFetcher, authStore
 
 /* ---------- Individual providers ---------- */
 
-func fetchAccountContext(ctx context.Context, store port.AccountStore, customerID string, logger *zap.Logger) *AccountContext {
+func fetchAccountContext(ctx context.Context, store port.AccountStore, customerID string, logger *zap.Logger, failed *atomic.Bool) *AccountContext {
 	acc, err := store.GetPrimaryAccount(ctx, customerID)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: account fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -222,9 +256,10 @@ func fetchAccountContext(ctx context.Context, store port.AccountStore, customerI
 func fetchCardsContext(ctx context.Context, store interface {
 	port.CreditCardStore
 	port.CreditCardInvoiceStore
-}, customerID string, logger *zap.Logger) *CardsContext {
+}, customerID string, logger *zap.Logger, failed *atomic.Bool) *CardsContext {
 	cards, err := store.ListCreditCards(ctx, customerID)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: cards fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -238,6 +273,11 @@ func fetchCardsContext(ctx context.Context, store interface {
 	cc := &CardsContext{
 		Cards: make([]CardSummary, len(cards)),
 	}
+	// Faturas de cada cartão em paralelo — um round-trip por cartão, então a
+	// latência fica limitada pelo cartão mais lento, não pela soma.
+	// Cada goroutine escreve só no seu índice; a ordem final segue a dos cartões.
+	perCard := make([][]InvoiceSummary, len(cards))
+	var wg sync.WaitGroup
 	for i, c := range cards {
 		cc.Cards[i] = CardSummary{
 			CardID:         c.ID,
@@ -252,27 +292,37 @@ func fetchCardsContext(ctx context.Context, store interface {
 			BillingDay:     c.BillingDay,
 		}
 
-		// Buscar faturas abertas/pendentes para cada cartão
-		invoices, err := store.ListCreditCardInvoices(ctx, customerID, c.ID)
-		if err != nil {
-			logger.Warn("financial context: invoices fetch failed",
-				zap.String("card_id", c.ID),
-				zap.Error(err),
-			)
-			continue
-		}
-		for _, inv := range invoices {
-			if inv.Status == "open" || inv.Status == "overdue" || inv.Status == "closed" {
-				cc.Invoices = append(cc.Invoices, InvoiceSummary{
-					CardID:         c.ID,
-					ReferenceMonth: inv.ReferenceMonth,
-					TotalAmount:    inv.TotalAmount,
-					MinimumPayment: inv.MinimumPayment,
-					DueDate:        inv.DueDate,
-					Status:         inv.Status,
-				})
+		wg.Add(1)
+		go func(i int, cardID string) {
+			defer wg.Done()
+			// Buscar faturas abertas/pendentes para cada cartão
+			invoices, err := store.ListCreditCardInvoices(ctx, customerID, cardID)
+			if err != nil {
+				failed.Store(true)
+				logger.Warn("financial context: invoices fetch failed",
+					zap.String("card_id", cardID),
+					zap.Error(err),
+				)
+				return
 			}
-		}
+			for _, inv := range invoices {
+				if inv.Status == "open" || inv.Status == "overdue" || inv.Status == "closed" {
+					perCard[i] = append(perCard[i], InvoiceSummary{
+						CardID:         cardID,
+						ReferenceMonth: inv.ReferenceMonth,
+						TotalAmount:    inv.TotalAmount,
+						MinimumPayment: inv.MinimumPayment,
+						DueDate:        inv.DueDate,
+						Status:         inv.Status,
+					})
+				}
+			}
+		}(i, c.ID)
+	}
+	wg.Wait()
+
+	for _, invs := range perCard {
+		cc.Invoices = append(cc.Invoices, invs...)
 	}
 
 	return cc
@@ -282,12 +332,13 @@ func fetchPixContext(ctx context.Context, store interface {
 	port.PixKeyStore
 	port.PixTransferStore
 	port.ScheduledTransferStore
-}, customerID string, logger *zap.Logger) *PixContext {
+}, customerID string, logger *zap.Logger, failed *atomic.Bool) *PixContext {
 	pc := &PixContext{}
 
 	// Chaves PIX
 	keys, err := store.ListPixKeys(ctx, customerID)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: pix keys fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -306,6 +357,7 @@ func fetchPixContext(ctx context.Context, store interface {
 	// Transferências recentes (page 1, 10 itens)
 	transfers, err := store.ListPixTransfers(ctx, customerID, 1, 10)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: pix transfers fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -326,6 +378,7 @@ func fetchPixContext(ctx context.Context, store interface {
 	// Transferências agendadas
 	scheduled, err := store.ListScheduledTransfers(ctx, customerID)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: scheduled transfers fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -350,12 +403,13 @@ func fetchPixContext(ctx context.Context, store interface {
 	return pc
 }
 
-func fetchBillingContext(ctx context.Context, store port.BillingStore, customerID string, logger *zap.Logger) *BillingContext {
+func fetchBillingContext(ctx context.Context, store port.BillingStore, customerID string, logger *zap.Logger, failed *atomic.Bool) *BillingContext {
 	bc := &BillingContext{}
 
 	// Boletos recentes (page 1, 10 itens)
 	bills, err := store.ListBillPayments(ctx, customerID, 1, 10)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: bills fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -375,6 +429,7 @@ func fetchBillingContext(ctx context.Context, store port.BillingStore, customerI
 	// Compras no débito recentes (page 1, 10 itens)
 	debits, err := store.ListDebitPurchases(ctx, customerID, 1, 10)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: debit purchases fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -398,9 +453,10 @@ func fetchBillingContext(ctx context.Context, store port.BillingStore, customerI
 	return bc
 }
 
-func fetchProfileContext(ctx context.Context, store port.AuthStore, customerID string, logger *zap.Logger) *ProfileContext {
+func fetchProfileContext(ctx context.Context, store port.AuthStore, customerID string, logger *zap.Logger, failed *atomic.Bool) *ProfileContext {
 	profile, err := store.GetCustomerByID(ctx, customerID)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: profile fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -423,9 +479,10 @@ func fetchProfileContext(ctx context.Context, store port.AuthStore, customerID s
 	}
 }
 
-func fetchAnalyticsContext(ctx context.Context, store port.AnalyticsStore, customerID string, logger *zap.Logger) *AnalyticsContext {
+func fetchAnalyticsContext(ctx context.Context, store port.AnalyticsStore, customerID string, logger *zap.Logger, failed *atomic.Bool) *AnalyticsContext {
 	summary, err := store.GetSpendingSummary(ctx, customerID, "monthly")
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: analytics fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -474,14 +531,16 @@ func fetchAnalyticsContext(ctx context.Context, store port.AnalyticsStore, custo
 	}
 }
 
-func fetchTransactionsContext(ctx context.Context, store port.AnalyticsStore, customerID string, logger *zap.Logger) *TransactionsContext {
+func fetchTransactionsContext(ctx context.Context, store port.AnalyticsStore, customerID string, logger *zap.Logger, failed *atomic.Bool) *TransactionsContext {
 	// Buscar transações dos últimos 90 dias (limite de 30 para não estourar o payload)
 	now := time.Now().UTC()
 	from := now.AddDate(0, -3, 0).Format("2006-01-02")
 	to := now.AddDate(0, 0, 1).Format("2006-01-02")
 
-	txns, err := store.ListTransactions(ctx, customerID, from, to)
+	// O limite vai direto na query — antes vinham até 1000 linhas para usar só 30
+	txns, err := store.ListRecentTransactions(ctx, customerID, from, to, recentTransactionsLimit)
 	if err != nil {
+		failed.Store(true)
 		logger.Warn("financial context: transactions fetch failed",
 			zap.String("customer_id", customerID),
 			zap.Error(err),
@@ -492,8 +551,8 @@ func fetchTransactionsContext(ctx context.Context, store port.AnalyticsStore, cu
 		return nil
 	}
 
-	// Limitar a 30 transações mais recentes (já vem desc por date)
-	limit := 30
+	// Limitar às transações mais recentes (já vem desc por date)
+	limit := recentTransactionsLimit
 	if len(txns) < limit {
 		limit = len(txns)
 	}
@@ -2,17 +2,34 @@ package chat
 
 import (
 	"encoding/json"
+	"errors"
 	"net/http"
 
 	"github.com/go-chi/chi/v5"
 	"go.uber.org/zap"
 )
 
+// maxChatBodyBytes é o tamanho máximo aceito no body de POST /v1/chat.
+// Um turno de chat é uma mensagem curta; 64 KiB sobra com folga.
+const maxChatBodyBytes = 64 << 10
+
 // Handler retorna um http.HandlerFunc para POST /v1/chat e POST /v1/chat/{customerID}.
 func Handler(svc *Service, logger *zap.Logger) http.HandlerFunc {
 	return func(w http.ResponseWriter, r *http.Request) {
+		// Limita o body antes de decodificar: o custo do parse (e de tudo que
+		// vem depois com a query) fica limitado, qualquer que seja o tamanho
+		// enviado pelo cliente.
+		r.Body = http.MaxBytesReader(w, r.Body, maxChatBodyBytes)
+
 		var req FrontendRequest
 		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+			var tooLarge *http.MaxBytesError
+			if errors.As(err, &tooLarge) {
+				writeJSON(w, http.StatusRequestEntityTooLarge, map[string]string{
+					"error": "request body too large",
+				})
+				return
+			}
 			logger.Warn("chat: invalid request body", zap.Error(err))
 			writeJSON(w, http.StatusBadRequest, map[string]string{
 				"error": "invalid request body",
@@ -62,9 +79,7 @@ func Handler(svc *Service, logger *zap.Logger) http.HandlerFunc {
 func writeJSON(w http.ResponseWriter, status int, v any) {
 	w.Header().Set("Content-Type", "application/json; charset=utf-8")
 	w.WriteHeader(status)
-	enc := json.NewEncoder(w)
-	enc.SetIndent("", "  ")
-	enc.Encode(v)
+	json.NewEncoder(w).Encode(v)
 }
 
 func truncate(s string, max int) string {
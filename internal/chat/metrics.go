@@ -5,6 +5,7 @@ import (
 	"fmt"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/infra/supabase"
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/port"
 	"go.uber.org/zap"
 )
 
@@ -158,6 +159,36 @@ func (r *SupabaseMetricsRepository) GetChatMetrics(ctx context.Context) (*ChatMe
 	}, nil
 }
 
+/* Cache */
+
+// chatMetricsCacheKey — as métricas são globais (não dependem do cliente),
+// então uma única entrada basta.
+const chatMetricsCacheKey = "chat:metrics"
+
+// CachedMetricsRepository evita rodar o RPC get_chat_metrics (agregação sobre
+// todas as transcrições/avaliações) a cada refresh do dashboard. Os números só
+// mudam de forma perceptível em escala de minutos, então um TTL curto basta.
+type CachedMetricsRepository struct {
+	next  MetricsRepository
+	cache port.Cache[*ChatMetricsResponse]
+}
+
+func NewCachedMetricsRepository(next MetricsRepository, cache port.Cache[*ChatMetricsResponse]) *CachedMetricsRepository {
+	return &CachedMetricsRepository{next: next, cache: cache}
+}
+
+func (r *CachedMetricsRepository) GetChatMetrics(ctx context.Context) (*ChatMetricsResponse, error) {
+	if cached, ok := r.cache.Get(chatMetricsCacheKey); ok {
+		return cached, nil
+	}
+	resp, err := r.next.GetChatMetrics(ctx)
+	if err != nil {
+		return nil, err
+	}
+	r.cache.Set(chatMetricsCacheKey, resp)
+	return resp, nil
+}
+
 /* In-memory stub (para testes) */
 
 type InMemoryMetricsRepository struct {
@@ -1,5 +1,11 @@
 package chat
 
+import (
+	"encoding/json"
+	"sort"
+	"sync/atomic"
+)
+
 /*
  * Modelos — contratos exatos com o Agent Python e o frontend
  */
@@ -53,6 +59,8 @@ type FinancialContext struct {
 	Transactions *TransactionsContext `json:"transactions,omitempty"`
 	FetchedAt    string               `json:"fetched_at"`   // RFC3339
 	ContextKeys  []string             `json:"context_keys"` // quais sub-contextos foram preenchidos
+
+	partial bool // algum provider falhou — snapshot incompleto, não vai para o cache
 }
 
 // AccountContext — saldo, limites e dados da conta corrente.
@@ -228,19 +236,19 @@ type CollectedItem struct {
 /* Agent Python → BFA */
 
 type AgentResponse struct {
-	CustomerID       string         `json:"customer_id"`
-	Answer           string         `json:"answer"`
-	RagContexts      []string       `json:"rag_contexts"`
-	Context          string         `json:"context"`
-	Intent           *string        `json:"intent"`
-	Confidence       float64        `json:"confidence"`
-	Step             *string        `json:"step"`
-	FieldValue       *string        `json:"field_value"`
-	NextStep         *string        `json:"next_step"`
-	RequiredContexts []string       `json:"required_contexts"`
-	SuggestedActions []string       `json:"suggested_actions"`
-	Metadata         map[string]any `json:"metadata"`
-	Timestamp        string         `json:"timestamp"`
+	CustomerID       string          `json:"customer_id"`
+	Answer           string          `json:"answer"`
+	RagContexts      []string        `json:"rag_contexts"`
+	Context          string          `json:"context"`
+	Intent           *string         `json:"intent"`
+	Confidence       float64         `json:"confidence"`
+	Step             *string         `json:"step"`
+	FieldValue       *string         `json:"field_value"`
+	NextStep         *string         `json:"next_step"`
+	RequiredContexts []string        `json:"required_contexts"`
+	SuggestedActions []string        `json:"suggested_actions"`
+	Metadata         json.RawMessage `json:"metadata"` // opaco para o BFA — mantido cru, sem decodificar em map[string]any
+	Timestamp        string          `json:"timestamp"`
 }
 
 /* History entry */
@@ -260,6 +268,8 @@ type Session struct {
 	OnboardingData map[string]string
 	LastStep       string // último step em que estávamos (para controle de retries)
 	Retries        int    // quantas tentativas inválidas consecutivas no step atual
+
+	lastSeen atomic.Int64 // unix nano do último SessionStore.Get (para expurgo de ociosas)
 }
 
 const MaxRetries = 3
@@ -293,22 +303,52 @@ func (s *Session) MissingFields() []string {
 
 // CollectedData converte os dados já validados da sessão em lista genérica de chave/valor.
 // Não expõe password/passwordConfirmation ao agente.
+//
+// A ordem é estável (ordem de RequiredOnboardingFields, depois chaves extras em
+// ordem alfabética): iterar o map direto gerava um payload diferente a cada turno
+// para os mesmos dados, o que impede o backend do LLM de reaproveitar o prefixo
+// do prompt entre chamadas.
 func (s *Session) CollectedData() []CollectedItem {
-	items := make([]CollectedItem, 0)
-	for key, value := range s.OnboardingData {
+	items := make([]CollectedItem, 0, len(s.OnboardingData))
+	add := func(key string) {
 		// Não enviar senhas ao agente
 		if key == "password" || key == "passwordConfirmation" {
-			continue
+			return
+		}
+		if value, ok := s.OnboardingData[key]; ok {
+			items = append(items, CollectedItem{
+				Key:       key,
+				Value:     value,
+				Validated: true,
+			})
 		}
-		items = append(items, CollectedItem{
-			Key:       key,
-			Value:     value,
-			Validated: true,
-		})
+	}
+
+	for _, key := range RequiredOnboardingFields {
+		add(key)
+	}
+	var extra []string
+	for key := range s.OnboardingData {
+		if !isRequiredOnboardingField(key) {
+			extra = append(extra, key)
+		}
+	}
+	sort.Strings(extra)
+	for _, key := range extra {
+		add(key)
 	}
 	return items
 }
 
+func isRequiredOnboardingField(key string) bool {
+	for _, f := range RequiredOnboardingFields {
+		if f == key {
+			return true
+		}
+	}
+	return false
+}
+
 // helper para ponteiro de string
 func strPtr(s string) *string { return &s }
 
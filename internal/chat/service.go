@@ -26,13 +26,14 @@ type Service struct {
 	repo                 AccountRepository
 	transcripts          TranscriptRepository
 	evaluations          EvaluationRepository
-	ctxFetcher           ContextFetcher // dados financeiros (pode ser nil)
-	authStore            port.AuthStore // perfil do cliente (pode ser nil)
-	historyAnonymousOnly bool           // se true, só envia history para usuários não-logados
+	ctxFetcher           ContextFetcher                // dados financeiros (pode ser nil)
+	authStore            port.AuthStore                // perfil do cliente (pode ser nil)
+	ctxCache             port.Cache[*FinancialContext] // contexto financeiro recente por cliente (pode ser nil)
+	historyAnonymousOnly bool                          // se true, só envia history para usuários não-logados
 	logger               *zap.Logger
 }
 
-func NewService(client *Client, sessions *SessionStore, repo AccountRepository, transcripts TranscriptRepository, evaluations EvaluationRepository, ctxFetcher ContextFetcher, authStore port.AuthStore, historyAnonymousOnly bool, logger *zap.Logger) *Service {
+func NewService(client *Client, sessions *SessionStore, repo AccountRepository, transcripts TranscriptRepository, evaluations EvaluationRepository, ctxFetcher ContextFetcher, authStore port.AuthStore, ctxCache port.Cache[*FinancialContext], historyAnonymousOnly bool, logger *zap.Logger) *Service {
 	return &Service{
 		client:               client,
 		sessions:             sessions,
@@ -42,6 +43,7 @@ func NewService(client *Client, sessions *SessionStore, repo AccountRepository,
 		evaluations:          evaluations,
 		ctxFetcher:           ctxFetcher,
 		authStore:            authStore,
+		ctxCache:             ctxCache,
 		historyAnonymousOnly: historyAnonymousOnly,
 		logger:               logger,
 	}
@@ -66,8 +68,24 @@ func (s *Service) ProcessTurn(ctx context.Context, customerID, query string, isA
 
 	session := s.sessions.Get(customerID)
 
-	// Retomada: se a sessão em memória está vazia, tentar carregar do banco
-	if len(session.OnboardingData) == 0 {
+	// ── Buscar contexto financeiro completo (se autenticado) ──
+	// Disparado em paralelo com a retomada de sessão: são I/Os independentes
+	// (Supabase) e o agente só é chamado depois que ambos terminam.
+	var financialCtx *FinancialContext
+	ctxDone := make(chan struct{})
+	if customerID != "anonymous" && s.ctxFetcher != nil {
+		go func() {
+			defer close(ctxDone)
+			financialCtx = s.financialContext(ctx, customerID)
+		}()
+	} else {
+		close(ctxDone)
+	}
+
+	// Retomada: se a sessão em memória está vazia, tentar carregar do banco.
+	// Só faz sentido no fluxo anônimo — onboarding é bloqueado para autenticados,
+	// então para eles a consulta ao onboarding_sessions seria sempre desperdiçada.
+	if !isAuthenticated && len(session.OnboardingData) == 0 {
 		if savedData, err := s.repo.LoadSession(ctx, customerID); err == nil && savedData != nil {
 			for k, v := range savedData {
 				session.OnboardingData[k] = v
@@ -79,11 +97,7 @@ func (s *Service) ProcessTurn(ctx context.Context, customerID, query string, isA
 		}
 	}
 
-	// ── Buscar contexto financeiro completo (se autenticado) ──
-	var financialCtx *FinancialContext
-	if customerID != "anonymous" && s.ctxFetcher != nil {
-		financialCtx = BuildFinancialContext(ctx, s.ctxFetcher, s.authStore, customerID, s.logger)
-	}
+	<-ctxDone
 
 	// ── Chamada única ao agente — com tudo ──
 	start := time.Now()
@@ -134,10 +148,33 @@ func (s *Service) ProcessTurn(ctx context.Context, customerID, query string, isA
 	return frontResp, procErr
 }
 
+// financialContext devolve o contexto financeiro do cliente, reaproveitando o
+// snapshot em cache quando ainda está dentro do TTL. Turnos seguidos da mesma
+// conversa evitam assim refazer as ~7 consultas ao Supabase a cada mensagem.
+// O cache é opt-in (CHAT_CONTEXT_CACHE_TTL): saldo e extrato podem ficar até um
+// TTL atrás de um Pix/pagamento recém-feito. Snapshots parciais nunca são cacheados.
+func (s *Service) financialContext(ctx context.Context, customerID string) *FinancialContext {
+	if s.ctxCache == nil {
+		return BuildFinancialContext(ctx, s.ctxFetcher, s.authStore, customerID, s.logger)
+	}
+
+	cacheKey := "chatctx:" + customerID
+	if fc, ok := s.ctxCache.Get(cacheKey); ok {
+		s.logger.Debug("contexto financeiro servido do cache", zap.String("customer_id", customerID))
+		return fc
+	}
+
+	fc := BuildFinancialContext(ctx, s.ctxFetcher, s.authStore, customerID, s.logger)
+	if fc != nil && !fc.partial {
+		s.ctxCache.Set(cacheKey, fc)
+	}
+	return fc
+}
+
 // callAgent monta o AgentRequest e chama o Agent Python.
 func (s *Service) callAgent(ctx context.Context, customerID, query string, session *Session, validationError string, financialCtx *FinancialContext, isAuthenticated bool) (*AgentResponse, error) {
 	// Se historyAnonymousOnly=true e o usuário está logado, não envia history
-	history := session.History
+	history := recentHistory(session.History)
 	if s.historyAnonymousOnly && isAuthenticated {
 		history = []ChatMessage{} // Python espera [] e não null
 	}
@@ -358,10 +395,11 @@ func (s *Service) processAgentResponse(ctx context.Context, customerID, query st
 	if !hasValidator {
 		// Step desconhecido — salva sem validação, pass-through
 		s.logger.Warn("no validator for step — accepting", zap.String("step", step))
-		session.OnboardingData[step] = strings.TrimSpace(query)
+		value := normalizeFieldValue(step, query) // normaliza uma vez só
+		session.OnboardingData[step] = value
 		s.appendHistory(session, query, resp.Answer, &step, boolPtr(true))
 
-		if saveErr := s.repo.SaveField(ctx, customerID, step, strings.TrimSpace(query)); saveErr != nil {
+		if saveErr := s.repo.SaveField(ctx, customerID, step, value); saveErr != nil {
 			s.logger.Error("failed to save field", zap.String("step", step), zap.Error(saveErr))
 		}
 
@@ -498,8 +536,21 @@ func (s *Service) checkCompletion(ctx context.Context, customerID, query string,
 	return s.buildResponse(resp, accountData), nil
 }
 
+// maxHistoryTurns limita quantos turnos do history vão para o agente.
+// Sessões autenticadas não terminam em FinalizeAccount, então sem limite o
+// history (e o payload de cada request) cresceria indefinidamente.
+const maxHistoryTurns = 50
+
 // appendHistory adiciona uma entrada no history da sessão.
+// Descarte amortizado O(1): o slice cresce até 2×maxHistoryTurns e só então
+// os últimos maxHistoryTurns são copiados para o início, reaproveitando o
+// mesmo array em vez de realocar (ou deslocar) a cada turno.
 func (s *Service) appendHistory(session *Session, query, answer string, step *string, validated *bool) {
+	if len(session.History) >= 2*maxHistoryTurns {
+		n := copy(session.History, session.History[len(session.History)-maxHistoryTurns:])
+		clear(session.History[n:])
+		session.History = session.History[:n]
+	}
 	session.History = append(session.History, ChatMessage{
 		Query:     query,
 		Answer:    answer,
@@ -508,6 +559,14 @@ func (s *Service) appendHistory(session *Session, query, answer string, step *st
 	})
 }
 
+// recentHistory retorna no máximo os últimos maxHistoryTurns turnos.
+func recentHistory(history []ChatMessage) []ChatMessage {
+	if len(history) > maxHistoryTurns {
+		return history[len(history)-maxHistoryTurns:]
+	}
+	return history
+}
+
 // buildResponse monta a FrontendResponse a partir da AgentResponse.
 // NUNCA sobrescreve step/next_step — o agente controla a jornada.
 // Sanitiza o answer para remover textos técnicos internos (CAMPO_ACEITO_BFA, etc).
@@ -524,17 +583,32 @@ func (s *Service) buildResponse(resp *AgentResponse, accountData *AccountData) *
 // sanitizeAnswer remove textos técnicos internos do answer antes de enviar ao frontend.
 // Isso protege contra o agente Python colar o validation_error no answer.
 func sanitizeAnswer(answer string) string {
-	// Remover linhas que contenham sinais internos do BFA
-	lines := strings.Split(answer, "\n")
-	var clean []string
-	for _, line := range lines {
-		trimmed := strings.TrimSpace(line)
-		if strings.Contains(trimmed, "CAMPO_ACEITO_BFA") {
-			continue
+	const marker = "CAMPO_ACEITO_BFA"
+
+	// Uma única varredura: cada ocorrência do marcador já localiza a linha a
+	// remover, em vez de testar o texto inteiro e depois linha a linha.
+	// Remover "linha\n" equivale a refazer o Join das linhas restantes; o
+	// \n que sobra quando a última linha cai é eliminado pelo TrimSpace.
+	result := answer
+	if i := strings.Index(answer, marker); i >= 0 {
+		var b strings.Builder
+		b.Grow(len(answer))
+		rest := answer
+		for i >= 0 {
+			start := strings.LastIndexByte(rest[:i], '\n') + 1
+			b.WriteString(rest[:start])
+			end := strings.IndexByte(rest[i:], '\n')
+			if end < 0 {
+				rest = ""
+				break
+			}
+			rest = rest[i+end+1:]
+			i = strings.Index(rest, marker)
 		}
-		clean = append(clean, line)
+		b.WriteString(rest)
+		result = b.String()
 	}
-	result := strings.TrimSpace(strings.Join(clean, "\n"))
+	result = strings.TrimSpace(result)
 	if result == "" {
 		return "Dado recebido! Continuando..."
 	}
@@ -566,15 +640,16 @@ func (s *Service) saveTranscriptAsync(customerID, query string, resp *AgentRespo
 		TokensUsed:    tokensUsed,
 	}
 
-	// Serializar contexto financeiro para persistência
-	if financialCtx != nil {
-		t.FinancialContextKeys = financialCtx.ContextKeys
-		if raw, err := json.Marshal(financialCtx); err == nil {
-			t.FinancialContextRaw = string(raw)
+	go func() {
+		// Serializar contexto financeiro para persistência — feito aqui, fora do
+		// caminho da resposta: o snapshot é somente leitura depois de montado.
+		if financialCtx != nil {
+			t.FinancialContextKeys = financialCtx.ContextKeys
+			if raw, err := json.Marshal(financialCtx); err == nil {
+				t.FinancialContextRaw = string(raw)
+			}
 		}
-	}
 
-	go func() {
 		ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 		defer cancel()
 		if err := s.transcripts.SaveTranscript(ctx, t); err != nil {
@@ -3,12 +3,17 @@ package chat
 import (
 	"context"
 	"encoding/json"
+	"fmt"
 	"net/http"
 	"net/http/httptest"
 	"strings"
+	"sync/atomic"
 	"testing"
 	"time"
 
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/infra/cache"
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/port"
 	"go.uber.org/zap"
 )
 
@@ -30,7 +35,7 @@ func newTestService(agentURL string) *Service {
 	repo := NewInMemoryAccountRepository(logger)
 	transcripts := NewInMemoryTranscriptRepository(logger)
 	evaluations := NewInMemoryEvaluationRepository(logger)
-	return NewService(client, sessions, repo, transcripts, evaluations, nil, nil, true, logger)
+	return NewService(client, sessions, repo, transcripts, evaluations, nil, nil, nil, true, logger)
 }
 
 var ctx = context.Background()
@@ -117,6 +122,50 @@ func TestValidateBirthDate_InvalidFormat(t *testing.T) {
 	}
 }
 
+func TestIsDateShape(t *testing.T) {
+	tests := []struct {
+		in   string
+		want bool
+	}{
+		{"15/06/1990", true},
+		{"00/00/0000", true}, // só o formato; time.Parse valida a data
+		{"15-06-1990", false},
+		{"15.06.1990", false},
+		{"1990/06/15", false},
+		{"5/06/1990", false},
+		{"15/6/1990", false},
+		{"15/06/90", false},
+		{"15/06/19900", false},
+		{"", false},
+		{"15/06/199a", false},
+		{"١٥/٠٦/١٩٩٠", false}, // dígitos arábico-índicos
+		{"１５/０６/１９９０", false}, // dígitos fullwidth
+	}
+	for _, tt := range tests {
+		if got := isDateShape(tt.in); got != tt.want {
+			t.Errorf("isDateShape(%q) = %v, want %v", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestOnlyDigits(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{"", ""},
+		{"12345678000190", "12345678000190"},     // atalho: já só dígitos ASCII
+		{"12.345.678/0001-90", "12345678000190"}, // caminho lento
+		{"١٢٣", "١٢٣"},                           // dígitos não-ASCII: unicode.IsDigit mantém
+		{"CPF: ١٢٣-4", "١٢٣4"},
+	}
+	for _, tt := range tests {
+		if got := onlyDigits(tt.in); got != tt.want {
+			t.Errorf("onlyDigits(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
+
 /*
  * Test: Password (6 digits)
  */
@@ -802,6 +851,41 @@ func TestSanitizeAnswer_RemovesCampoAceitoBFA(t *testing.T) {
 			input:  "  CAMPO_ACEITO_BFA: salvo  ",
 			expect: "Dado recebido! Continuando...",
 		},
+		{
+			name:   "marker on last line without trailing newline",
+			input:  "Qual o Nome Fantasia?\nCAMPO_ACEITO_BFA: salvo",
+			expect: "Qual o Nome Fantasia?",
+		},
+		{
+			name:   "marker on last line with trailing newline",
+			input:  "Qual o Nome Fantasia?\nCAMPO_ACEITO_BFA: salvo\n",
+			expect: "Qual o Nome Fantasia?",
+		},
+		{
+			name:   "two markers on one line",
+			input:  "CAMPO_ACEITO_BFA CAMPO_ACEITO_BFA\nQual o Nome Fantasia?",
+			expect: "Qual o Nome Fantasia?",
+		},
+		{
+			name:   "markers on consecutive lines",
+			input:  "Perfeito!\nCAMPO_ACEITO_BFA: cnpj\nCAMPO_ACEITO_BFA: email\nQual o telefone?",
+			expect: "Perfeito!\nQual o telefone?",
+		},
+		{
+			name:   "marker line in the middle",
+			input:  "Perfeito!\nCAMPO_ACEITO_BFA: cnpj\nQual o telefone?",
+			expect: "Perfeito!\nQual o telefone?",
+		},
+		{
+			name:   "CRLF input",
+			input:  "Perfeito!\r\nCAMPO_ACEITO_BFA: cnpj\r\nQual o telefone?\r\n",
+			expect: "Perfeito!\r\nQual o telefone?",
+		},
+		{
+			name:   "every line is a marker",
+			input:  "CAMPO_ACEITO_BFA: cnpj\nCAMPO_ACEITO_BFA: email\n  CAMPO_ACEITO_BFA  ",
+			expect: "Dado recebido! Continuando...",
+		},
 	}
 
 	for _, tc := range tests {
@@ -814,6 +898,88 @@ func TestSanitizeAnswer_RemovesCampoAceitoBFA(t *testing.T) {
 	}
 }
 
+/*
+ * Test: CollectedData has a stable order and hides passwords
+ */
+
+func TestSession_CollectedData_StableOrder(t *testing.T) {
+	session := &Session{OnboardingData: map[string]string{
+		"email":                "contato@empresa.com",
+		"password":             "Senha@123",
+		"cnpj":                 "11222333000181",
+		"passwordConfirmation": "Senha@123",
+		"zExtra":               "z",
+		"aExtra":               "a",
+		"razaoSocial":          "Empresa LTDA",
+	}}
+
+	want := []string{"cnpj", "razaoSocial", "email", "aExtra", "zExtra"}
+	for run := 0; run < 20; run++ {
+		items := session.CollectedData()
+		if len(items) != len(want) {
+			t.Fatalf("expected %d items, got %d: %+v", len(want), len(items), items)
+		}
+		for i, key := range want {
+			if items[i].Key != key {
+				t.Fatalf("run %d: item %d = %q, want %q", run, i, items[i].Key, key)
+			}
+		}
+	}
+}
+
+func TestAppendHistory_KeepsRecentTurns(t *testing.T) {
+	svc := &Service{}
+	session := &Session{}
+
+	total := 3*maxHistoryTurns + 7
+	for i := 0; i < total; i++ {
+		svc.appendHistory(session, fmt.Sprintf("q%d", i), "a", nil, nil)
+	}
+
+	if len(session.History) > 2*maxHistoryTurns {
+		t.Fatalf("history should stay bounded, got %d entries", len(session.History))
+	}
+	recent := recentHistory(session.History)
+	if len(recent) != maxHistoryTurns {
+		t.Fatalf("expected %d recent turns, got %d", maxHistoryTurns, len(recent))
+	}
+	if want := fmt.Sprintf("q%d", total-1); recent[len(recent)-1].Query != want {
+		t.Errorf("last turn = %q, want %q", recent[len(recent)-1].Query, want)
+	}
+	if want := fmt.Sprintf("q%d", total-maxHistoryTurns); recent[0].Query != want {
+		t.Errorf("first recent turn = %q, want %q", recent[0].Query, want)
+	}
+}
+
+func TestSessionStore_EvictsIdleSessions(t *testing.T) {
+	store := NewSessionStore()
+
+	idle := store.Get("cust-idle")
+	idle.lastSeen.Store(time.Now().Add(-2 * sessionIdleTTL).UnixNano())
+	shard := store.shardFor("cust-idle")
+
+	// Preenche a mesma fatia até disparar a varredura dela
+	var active *Session
+	for i, created := 0, 1; created < sessionSweepEvery; i++ {
+		id := fmt.Sprintf("cust-%d", i)
+		if store.shardFor(id) != shard {
+			continue
+		}
+		sess := store.Get(id)
+		if active == nil {
+			active = sess
+		}
+		created++
+	}
+
+	if _, ok := shard.sessions["cust-idle"]; ok {
+		t.Error("idle session should have been evicted")
+	}
+	if got := shard.sessions[active.CustomerID]; got != active {
+		t.Error("active session should have been kept")
+	}
+}
+
 /*
  * Test: MaxRetries exceeded triggers reset
  */
@@ -905,3 +1071,281 @@ func TestProcessTurn_AgentResetStep(t *testing.T) {
 		t.Errorf("session should be empty after reset, got %d fields", len(newSession.OnboardingData))
 	}
 }
+
+/*
+ * Test: Handler — limites e erros do body
+ */
+
+func TestHandler_BodyTooLarge(t *testing.T) {
+	h := Handler(newTestService("http://unused"), zap.NewNop())
+	body := `{"query":"` + strings.Repeat("a", maxChatBodyBytes) + `"}`
+	req := httptest.NewRequest(http.MethodPost, "/v1/chat", strings.NewReader(body))
+	rec := httptest.NewRecorder()
+
+	h.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusRequestEntityTooLarge {
+		t.Fatalf("expected 413, got %d", rec.Code)
+	}
+	var resp map[string]string
+	if err := json.NewDecoder(rec.Body).Decode(&resp); err != nil {
+		t.Fatalf("expected JSON error body: %v", err)
+	}
+	if resp["error"] != "request body too large" {
+		t.Errorf("unexpected error message: %q", resp["error"])
+	}
+}
+
+func TestHandler_MalformedJSON(t *testing.T) {
+	h := Handler(newTestService("http://unused"), zap.NewNop())
+	req := httptest.NewRequest(http.MethodPost, "/v1/chat", strings.NewReader(`{"query":`))
+	rec := httptest.NewRecorder()
+
+	h.ServeHTTP(rec, req)
+
+	if rec.Code != http.StatusBadRequest {
+		t.Fatalf("expected 400, got %d", rec.Code)
+	}
+	var resp map[string]string
+	if err := json.NewDecoder(rec.Body).Decode(&resp); err != nil {
+		t.Fatalf("expected JSON error body: %v", err)
+	}
+	if resp["error"] != "invalid request body" {
+		t.Errorf("unexpected error message: %q", resp["error"])
+	}
+}
+
+/*
+ * Test: cache do contexto financeiro
+ */
+
+// stubContextFetcher conta as idas ao "Supabase" (GetPrimaryAccount) e devolve
+// vazio nos demais providers. failPix simula falha isolada de um provider;
+// cards/invoices/failInvoices alimentam o provider de cartões.
+type stubContextFetcher struct {
+	ContextFetcher
+	balance      float64
+	failPix      bool
+	accountCalls atomic.Int32
+
+	cards        []domain.CreditCard
+	invoices     map[string][]domain.CreditCardInvoice // por card ID
+	failInvoices map[string]bool
+	slowInvoices map[string]time.Duration // atraso por card ID, embaralha a ordem de término
+}
+
+func (f *stubContextFetcher) GetPrimaryAccount(_ context.Context, customerID string) (*domain.Account, error) {
+	f.accountCalls.Add(1)
+	return &domain.Account{ID: "acc-" + customerID, Balance: f.balance}, nil
+}
+func (f *stubContextFetcher) ListCreditCards(context.Context, string) ([]domain.CreditCard, error) {
+	return f.cards, nil
+}
+func (f *stubContextFetcher) ListCreditCardInvoices(_ context.Context, _, cardID string) ([]domain.CreditCardInvoice, error) {
+	time.Sleep(f.slowInvoices[cardID])
+	if f.failInvoices[cardID] {
+		return nil, fmt.Errorf("faturas indisponíveis")
+	}
+	return f.invoices[cardID], nil
+}
+func (f *stubContextFetcher) ListPixKeys(context.Context, string) ([]domain.PixKey, error) {
+	if f.failPix {
+		return nil, fmt.Errorf("supabase indisponível")
+	}
+	return nil, nil
+}
+func (f *stubContextFetcher) ListPixTransfers(context.Context, string, int, int) ([]domain.PixTransfer, error) {
+	return nil, nil
+}
+func (f *stubContextFetcher) ListScheduledTransfers(context.Context, string) ([]domain.ScheduledTransfer, error) {
+	return nil, nil
+}
+func (f *stubContextFetcher) ListBillPayments(context.Context, string, int, int) ([]domain.BillPayment, error) {
+	return nil, nil
+}
+func (f *stubContextFetcher) ListDebitPurchases(context.Context, string, int, int) ([]domain.DebitPurchase, error) {
+	return nil, nil
+}
+func (f *stubContextFetcher) GetSpendingSummary(context.Context, string, string) (*domain.SpendingSummary, error) {
+	return nil, nil
+}
+func (f *stubContextFetcher) ListRecentTransactions(context.Context, string, string, string, int) ([]domain.Transaction, error) {
+	return nil, nil
+}
+
+type stubAuthStore struct{ port.AuthStore }
+
+func (stubAuthStore) GetCustomerByID(context.Context, string) (*domain.CustomerProfile, error) {
+	return nil, nil
+}
+
+func newContextTestService(fetcher ContextFetcher, ctxCache port.Cache[*FinancialContext]) *Service {
+	svc := newTestService("http://unused")
+	svc.ctxFetcher = fetcher
+	svc.authStore = stubAuthStore{}
+	svc.ctxCache = ctxCache
+	return svc
+}
+
+func TestFinancialContext_CacheHit(t *testing.T) {
+	fetcher := &stubContextFetcher{balance: 100}
+	svc := newContextTestService(fetcher, cache.New[*FinancialContext](time.Minute))
+
+	first := svc.financialContext(ctx, "cust-1")
+	fetcher.balance = 50 // mudança dentro do TTL não aparece
+	second := svc.financialContext(ctx, "cust-1")
+
+	if n := fetcher.accountCalls.Load(); n != 1 {
+		t.Errorf("expected 1 fetch, got %d", n)
+	}
+	if first != second || second.Account.Balance != 100 {
+		t.Errorf("expected cached snapshot with balance 100, got %+v", second.Account)
+	}
+}
+
+func TestFinancialContext_CacheMissAndExpiry(t *testing.T) {
+	fetcher := &stubContextFetcher{balance: 100}
+	svc := newContextTestService(fetcher, cache.New[*FinancialContext](20*time.Millisecond))
+
+	svc.financialContext(ctx, "cust-1")
+	svc.financialContext(ctx, "cust-2") // outro cliente: miss
+	if n := fetcher.accountCalls.Load(); n != 2 {
+		t.Fatalf("expected 2 fetches (one per customer), got %d", n)
+	}
+
+	time.Sleep(40 * time.Millisecond)
+	fetcher.balance = 50
+	fc := svc.financialContext(ctx, "cust-1")
+	if n := fetcher.accountCalls.Load(); n != 3 {
+		t.Errorf("expected refetch after TTL, got %d fetches", n)
+	}
+	if fc.Account.Balance != 50 {
+		t.Errorf("expected fresh balance 50, got %v", fc.Account.Balance)
+	}
+}
+
+func TestFinancialContext_NilCacheAlwaysFetches(t *testing.T) {
+	fetcher := &stubContextFetcher{balance: 100}
+	svc := newContextTestService(fetcher, nil)
+
+	svc.financialContext(ctx, "cust-1")
+	svc.financialContext(ctx, "cust-1")
+	if n := fetcher.accountCalls.Load(); n != 2 {
+		t.Errorf("expected 2 fetches without cache, got %d", n)
+	}
+}
+
+func TestFinancialContext_PartialNotCached(t *testing.T) {
+	fetcher := &stubContextFetcher{balance: 100, failPix: true}
+	svc := newContextTestService(fetcher, cache.New[*FinancialContext](time.Minute))
+
+	svc.financialContext(ctx, "cust-1")
+	svc.financialContext(ctx, "cust-1")
+	if n := fetcher.accountCalls.Load(); n != 2 {
+		t.Errorf("expected partial snapshot not to be cached (2 fetches), got %d", n)
+	}
+}
+
+func TestBuildFinancialContext_CardInvoicesKeepCardOrder(t *testing.T) {
+	fetcher := &stubContextFetcher{
+		cards: []domain.CreditCard{{ID: "card-a"}, {ID: "card-b"}, {ID: "card-c"}},
+		invoices: map[string][]domain.CreditCardInvoice{
+			"card-a": {
+				{ReferenceMonth: "2026-01", Status: "closed"},
+				{ReferenceMonth: "2026-02", Status: "open"},
+				{ReferenceMonth: "2025-12", Status: "paid"}, // fora do contexto
+			},
+			"card-b": {{ReferenceMonth: "2026-02", Status: "open"}},
+			"card-c": {{ReferenceMonth: "2026-02", Status: "overdue"}},
+		},
+		failInvoices: map[string]bool{"card-b": true},
+		// card-a termina por último: a ordem não pode depender do término
+		slowInvoices: map[string]time.Duration{"card-a": 30 * time.Millisecond},
+	}
+
+	fc := BuildFinancialContext(ctx, fetcher, stubAuthStore{}, "cust-1", zap.NewNop())
+	if fc == nil || fc.Cards == nil {
+		t.Fatal("expected cards context")
+	}
+
+	var cardIDs []string
+	for _, c := range fc.Cards.Cards {
+		cardIDs = append(cardIDs, c.CardID)
+	}
+	if got := strings.Join(cardIDs, ","); got != "card-a,card-b,card-c" {
+		t.Errorf("expected cards in listing order, got %s", got)
+	}
+
+	var invoices []string
+	for _, inv := range fc.Cards.Invoices {
+		invoices = append(invoices, inv.CardID+"/"+inv.ReferenceMonth)
+	}
+	// card-b falhou: fica fora das faturas, mas o cartão continua listado
+	if got := strings.Join(invoices, ","); got != "card-a/2026-01,card-a/2026-02,card-c/2026-02" {
+		t.Errorf("expected invoices grouped in card order, got %s", got)
+	}
+	if !fc.partial {
+		t.Error("expected failed invoice fetch to mark the context as partial")
+	}
+}
+
+/*
+ * Test: cache de métricas do chat
+ */
+
+// countingMetricsRepo conta as chamadas ao "RPC"; err != nil simula falha.
+type countingMetricsRepo struct {
+	calls atomic.Int32
+	err   error
+}
+
+func (r *countingMetricsRepo) GetChatMetrics(context.Context) (*ChatMetricsResponse, error) {
+	r.calls.Add(1)
+	if r.err != nil {
+		return nil, r.err
+	}
+	return &ChatMetricsResponse{}, nil
+}
+
+func TestCachedMetricsRepository_HitWithinTTL(t *testing.T) {
+	inner := &countingMetricsRepo{}
+	repo := NewCachedMetricsRepository(inner, cache.New[*ChatMetricsResponse](time.Minute))
+
+	first, _ := repo.GetChatMetrics(ctx)
+	second, _ := repo.GetChatMetrics(ctx)
+	if n := inner.calls.Load(); n != 1 {
+		t.Errorf("expected 1 inner call, got %d", n)
+	}
+	if first != second {
+		t.Error("expected the cached response on the second call")
+	}
+}
+
+func TestCachedMetricsRepository_RefetchAfterExpiry(t *testing.T) {
+	inner := &countingMetricsRepo{}
+	repo := NewCachedMetricsRepository(inner, cache.New[*ChatMetricsResponse](20*time.Millisecond))
+
+	repo.GetChatMetrics(ctx)
+	time.Sleep(40 * time.Millisecond)
+	repo.GetChatMetrics(ctx)
+	if n := inner.calls.Load(); n != 2 {
+		t.Errorf("expected refetch after TTL (2 inner calls), got %d", n)
+	}
+}
+
+func TestCachedMetricsRepository_ErrorNotCached(t *testing.T) {
+	inner := &countingMetricsRepo{err: fmt.Errorf("rpc indisponível")}
+	repo := NewCachedMetricsRepository(inner, cache.New[*ChatMetricsResponse](time.Minute))
+
+	if _, err := repo.GetChatMetrics(ctx); err == nil {
+		t.Fatal("expected error from inner repository")
+	}
+	inner.err = nil
+	resp, err := repo.GetChatMetrics(ctx)
+	if err != nil || resp == nil {
+		t.Fatalf("expected retry to succeed, got resp=%v err=%v", resp, err)
+	}
+	if n := inner.calls.Load(); n != 2 {
+		t.Errorf("expected the retry to reach the inner repository (2 calls), got %d", n)
+	}
+}
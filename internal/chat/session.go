@@ -1,40 +1,106 @@
 package chat
 
-import "sync"
+import (
+	"sync"
+	"time"
+)
+
+const (
+	// sessionShards — o mapa de sessões é dividido em N fatias, cada uma com
+	// seu próprio lock, para turnos de clientes diferentes não disputarem o
+	// mesmo mutex (criação de sessão e expurgo travam só a fatia).
+	sessionShards = 32
+	// sessionIdleTTL — sessões sem nenhum turno há mais que isso são expurgadas.
+	// Onboardings abandonados no meio nunca chegam ao FinalizeAccount/Delete.
+	sessionIdleTTL = 2 * time.Hour
+	// sessionSweepEvery — a varredura de uma fatia roda a cada N sessões criadas
+	// nela, então o custo fica amortizado no caminho de criação.
+	sessionSweepEvery = 256
+)
 
 // SessionStore guarda sessões em memória (mapa por customer_id).
 // Thread-safe para uso concorrente.
 type SessionStore struct {
+	shards  [sessionShards]sessionShard
+	idleTTL time.Duration
+}
+
+type sessionShard struct {
 	mu       sync.RWMutex
 	sessions map[string]*Session
+	created  int // sessões criadas nesta fatia desde a última varredura
 }
 
 func NewSessionStore() *SessionStore {
-	return &SessionStore{
-		sessions: make(map[string]*Session),
+	s := &SessionStore{idleTTL: sessionIdleTTL}
+	for i := range s.shards {
+		s.shards[i].sessions = make(map[string]*Session)
 	}
+	return s
+}
+
+// shardFor escolhe a fatia pelo hash FNV-1a do customerID (sem alocação).
+func (s *SessionStore) shardFor(customerID string) *sessionShard {
+	h := uint32(2166136261)
+	for i := 0; i < len(customerID); i++ {
+		h ^= uint32(customerID[i])
+		h *= 16777619
+	}
+	return &s.shards[h%sessionShards]
 }
 
 // Get retorna a sessão existente ou cria uma nova.
+// Caminho comum (sessão já existe) usa só o RLock da fatia.
 func (s *SessionStore) Get(customerID string) *Session {
-	s.mu.Lock()
-	defer s.mu.Unlock()
-
-	sess, ok := s.sessions[customerID]
-	if !ok {
-		sess = &Session{
-			CustomerID:     customerID,
-			History:        []ChatMessage{},
-			OnboardingData: make(map[string]string),
-		}
-		s.sessions[customerID] = sess
+	now := time.Now().UnixNano()
+	sh := s.shardFor(customerID)
+
+	sh.mu.RLock()
+	sess, ok := sh.sessions[customerID]
+	sh.mu.RUnlock()
+	if ok {
+		sess.lastSeen.Store(now)
+		return sess
+	}
+
+	sh.mu.Lock()
+	defer sh.mu.Unlock()
+	// Rechecagem: outra goroutine pode ter criado a sessão entre os locks
+	if sess, ok := sh.sessions[customerID]; ok {
+		sess.lastSeen.Store(now)
+		return sess
+	}
+
+	sh.created++
+	if sh.created >= sessionSweepEvery {
+		sh.created = 0
+		sh.evictIdleLocked(now - int64(s.idleTTL))
+	}
+
+	sess = &Session{
+		CustomerID:     customerID,
+		History:        []ChatMessage{},
+		OnboardingData: make(map[string]string),
 	}
+	sess.lastSeen.Store(now)
+	sh.sessions[customerID] = sess
 	return sess
 }
 
+// evictIdleLocked remove da fatia as sessões sem acesso desde cutoff.
+// Deve ser chamado com sh.mu travado para escrita.
+func (sh *sessionShard) evictIdleLocked(cutoff int64) {
+	for id, sess := range sh.sessions {
+		if sess.lastSeen.Load() < cutoff {
+			delete(sh.sessions, id)
+		}
+	}
+}
+
 // Delete remove a sessão do customer, liberando memória.
 func (s *SessionStore) Delete(customerID string) {
-	s.mu.Lock()
-	defer s.mu.Unlock()
-	delete(s.sessions, customerID)
+	sh := s.shardFor(customerID)
+	sh.mu.Lock()
+	defer sh.mu.Unlock()
+	delete(sh.sessions, customerID)
 }
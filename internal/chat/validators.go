@@ -77,7 +77,9 @@ var emailRegex = regexp.MustCompile(`^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-
 
 func (v *emailValidator) Validate(_ context.Context, value string, _ *Session) error {
 	trimmed := strings.TrimSpace(value)
-	if !emailRegex.MatchString(trimmed) {
+	// Triagem barata: sem '@' (resposta comum quando o usuário digita outra
+	// coisa no passo de e-mail) não há o que a regex aceitar.
+	if strings.IndexByte(trimmed, '@') < 0 || !emailRegex.MatchString(trimmed) {
 		return fmt.Errorf("e-mail inválido: formato esperado usuario@dominio.com")
 	}
 	return nil
@@ -116,11 +118,9 @@ func (v *phoneValidator) Validate(_ context.Context, value string, _ *Session) e
 
 type birthDateValidator struct{}
 
-var dateRegex = regexp.MustCompile(`^\d{2}/\d{2}/\d{4}$`)
-
 func (v *birthDateValidator) Validate(_ context.Context, value string, _ *Session) error {
 	trimmed := strings.TrimSpace(value)
-	if !dateRegex.MatchString(trimmed) {
+	if !isDateShape(trimmed) {
 		return fmt.Errorf("data deve estar no formato DD/MM/AAAA")
 	}
 
@@ -172,8 +172,40 @@ func (v *passwordConfirmationValidator) Validate(_ context.Context, value string
  * Helpers
  */
 
+// isDateShape reporta se s tem o formato DD/MM/AAAA (só dígitos e barras nas
+// posições fixas). Substitui a regex: o formato é fixo e time.Parse já faz a
+// validação semântica logo em seguida.
+func isDateShape(s string) bool {
+	if len(s) != 10 || s[2] != '/' || s[5] != '/' {
+		return false
+	}
+	for i := 0; i < len(s); i++ {
+		if i == 2 || i == 5 {
+			continue
+		}
+		if s[i] < '0' || s[i] > '9' {
+			return false
+		}
+	}
+	return true
+}
+
 func onlyDigits(s string) string {
+	// Atalho: valor já veio só com dígitos ASCII (caso comum vindo do
+	// frontend) — devolve a própria string, sem alocar.
+	clean := true
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
+			clean = false
+			break
+		}
+	}
+	if clean {
+		return s
+	}
+
 	var b strings.Builder
+	b.Grow(len(s))
 	for _, r := range s {
 		if unicode.IsDigit(r) {
 			b.WriteRune(r)
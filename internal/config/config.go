@@ -20,6 +20,8 @@ type Config struct {
 	ChatAgentURL       string        // URL do Agent Python para o chat (POST /v1/chat)
 	ChatMaxRetries     int           // quantas vezes retentar chamadas ao agente (0 = sem retry)
 	ChatRetryDelay     time.Duration // delay entre retries ao agente
+	ChatContextTTL     time.Duration // TTL do cache de contexto financeiro do chat (0 = sem cache)
+	ChatMetricsTTL     time.Duration // TTL do cache de GET /v1/chat/metrics (0 = sem cache)
 
 	// HTTP client
 	HTTPTimeout time.Duration
@@ -69,6 +71,8 @@ func Load() *Config {
 		ChatAgentURL:       getEnv("CHAT_AGENT_URL", "https://pj-assistant-agent-py-production.up.railway.app"),
 		ChatMaxRetries:     getEnvInt("CHAT_MAX_RETRIES", 3),
 		ChatRetryDelay:     getEnvDuration("CHAT_RETRY_DELAY", 500*time.Millisecond),
+		ChatContextTTL:     getEnvDuration("CHAT_CONTEXT_CACHE_TTL", 0),
+		ChatMetricsTTL:     getEnvDuration("CHAT_METRICS_CACHE_TTL", 30*time.Second),
 
 		HTTPTimeout: getEnvDuration("HTTP_TIMEOUT", 10*time.Second),
 
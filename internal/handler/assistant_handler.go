@@ -238,56 +238,63 @@ func getTransactionsHandler(svc *service.Assistant, logger *zap.Logger) http.Han
 			return
 		}
 
-		// Filter by type(s) if provided — e.g. ?type=pix_sent,pix_received
-		if typeFilter := r.URL.Query().Get("type"); typeFilter != "" {
-			allowedTypes := make(map[string]bool)
-			for _, t := range strings.Split(typeFilter, ",") {
-				t = strings.TrimSpace(t)
-				if t != "" {
-					allowedTypes[t] = true
-				}
-			}
-			if len(allowedTypes) > 0 {
-				filtered := make([]domain.Transaction, 0, len(transactions))
-				for _, tx := range transactions {
-					if allowedTypes[tx.Type] {
-						filtered = append(filtered, tx)
-					}
-				}
-				transactions = filtered
+		// Parse the query string once (r.URL.Query() re-parses on every call).
+		query := r.URL.Query()
+		// Filter by type(s) — e.g. ?type=pix_sent,pix_received
+		allowedTypes := parseFilterSet(query.Get("type"))
+		// Filter by category — e.g. ?category=pix,pix_credito
+		allowedCats := parseFilterSet(query.Get("category"))
+		limit := 0
+		if limitStr := query.Get("limit"); limitStr != "" {
+			if l, err := strconv.Atoi(limitStr); err == nil && l > 0 {
+				limit = l
 			}
 		}
 
-		// Filter by category if provided — e.g. ?category=pix,pix_credito
-		if catFilter := r.URL.Query().Get("category"); catFilter != "" {
-			allowedCats := make(map[string]bool)
-			for _, c := range strings.Split(catFilter, ",") {
-				c = strings.TrimSpace(c)
-				if c != "" {
-					allowedCats[c] = true
+		// Both filters and the limit are applied in a single pass, stopping as
+		// soon as the limit is reached instead of filtering the full list twice.
+		if allowedTypes != nil || allowedCats != nil {
+			filtered := make([]domain.Transaction, 0, len(transactions))
+			for i := range transactions {
+				if allowedTypes != nil && !allowedTypes[transactions[i].Type] {
+					continue
 				}
-			}
-			if len(allowedCats) > 0 {
-				filtered := make([]domain.Transaction, 0, len(transactions))
-				for _, tx := range transactions {
-					if allowedCats[tx.Category] {
-						filtered = append(filtered, tx)
-					}
+				if allowedCats != nil && !allowedCats[transactions[i].Category] {
+					continue
+				}
+				filtered = append(filtered, transactions[i])
+				if limit > 0 && len(filtered) == limit {
+					break
 				}
-				transactions = filtered
 			}
+			transactions = filtered
 		}
-
-		if limitStr := r.URL.Query().Get("limit"); limitStr != "" {
-			if limit, err := strconv.Atoi(limitStr); err == nil && limit > 0 && limit < len(transactions) {
-				transactions = transactions[:limit]
-			}
+		if limit > 0 && limit < len(transactions) {
+			transactions = transactions[:limit]
 		}
 
 		writeJSON(w, http.StatusOK, map[string]any{"transactions": transactions})
 	}
 }
 
+// parseFilterSet turns a comma-separated filter ("a, b,c") into a lookup set.
+// Returns nil when the filter is absent or has no non-empty values.
+func parseFilterSet(raw string) map[string]bool {
+	if raw == "" {
+		return nil
+	}
+	var set map[string]bool
+	for _, v := range strings.Split(raw, ",") {
+		if v = strings.TrimSpace(v); v != "" {
+			if set == nil {
+				set = make(map[string]bool)
+			}
+			set[v] = true
+		}
+	}
+	return set
+}
+
 func getTransactionsSummaryHandler(bankSvc *service.BankingService, logger *zap.Logger) http.HandlerFunc {
 	return func(w http.ResponseWriter, r *http.Request) {
 		ctx, span := tracer.Start(r.Context(), "GET /v1/customers/{customerId}/transactions/summary")
@@ -28,9 +28,9 @@ func writeError(w http.ResponseWriter, status int, msg string) {
 func writeJSON(w http.ResponseWriter, status int, data any) {
 	w.Header().Set("Content-Type", "application/json; charset=utf-8")
 	w.WriteHeader(status)
-	enc := json.NewEncoder(w)
-	enc.SetIndent("", "  ")
-	enc.Encode(data)
+	// Compact output: indentation only bloated large payloads (statements,
+	// transaction lists) and cost an extra formatting pass per response.
+	json.NewEncoder(w).Encode(data)
 }
 
 func parsePagination(r *http.Request) (page, pageSize int) {
@@ -1,12 +1,19 @@
 package handler_test
 
 import (
+	"context"
+	"encoding/json"
 	"net/http"
 	"net/http/httptest"
+	"strings"
 	"testing"
+	"time"
 
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/handler"
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/infra/cache"
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/infra/observability"
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/service"
 
 	"go.uber.org/zap"
 )
@@ -49,3 +56,63 @@ func TestMetrics(t *testing.T) {
 		t.Errorf("expected 200, got %d", rec.Code)
 	}
 }
+
+type stubTransactionsClient struct {
+	transactions []domain.Transaction
+}
+
+func (s *stubTransactionsClient) GetTransactions(_ context.Context, _ string) ([]domain.Transaction, error) {
+	return s.transactions, nil
+}
+
+func TestGetTransactions_FiltersAndLimit(t *testing.T) {
+	txns := []domain.Transaction{
+		{ID: "t1", Type: "pix_sent", Category: "pix"},
+		{ID: "t2", Type: "pix_received", Category: "pix"},
+		{ID: "t3", Type: "debit", Category: "supplier"},
+		{ID: "t4", Type: "pix_sent", Category: "pix"},
+		{ID: "t5", Type: "pix_sent", Category: "other"},
+		{ID: "t6", Type: "pix_received", Category: "pix"},
+	}
+	svc := service.NewAssistant(nil, &stubTransactionsClient{transactions: txns}, nil,
+		cache.New[any](time.Minute), observability.NewMetrics(), zap.NewNop())
+	router := handler.NewRouter(svc, nil, nil, nil, nil, observability.NewMetrics(), zap.NewNop())
+
+	tests := []struct {
+		name  string
+		query string
+		want  []string
+	}{
+		{"type + category + limit", "?type=pix_sent,pix_received&category=pix&limit=2", []string{"t1", "t2"}},
+		{"blank list entries are ignored", "?type=pix_sent,%20,&category=%20pix%20,", []string{"t1", "t4"}},
+		{"only blank entries means no filter", "?type=,%20&category=,", []string{"t1", "t2", "t3", "t4", "t5", "t6"}},
+		{"limit without filters", "?limit=3", []string{"t1", "t2", "t3"}},
+		{"limit larger than result set", "?limit=100", []string{"t1", "t2", "t3", "t4", "t5", "t6"}},
+		{"limit larger than filtered set", "?type=pix_sent&limit=10", []string{"t1", "t4", "t5"}},
+		{"invalid limit is ignored", "?category=supplier&limit=abc", []string{"t3"}},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest(http.MethodGet, "/v1/customers/cust-1/transactions"+tt.query, nil)
+			rec := httptest.NewRecorder()
+			router.ServeHTTP(rec, req)
+
+			if rec.Code != http.StatusOK {
+				t.Fatalf("expected 200, got %d", rec.Code)
+			}
+			var body struct {
+				Transactions []domain.Transaction `json:"transactions"`
+			}
+			if err := json.NewDecoder(rec.Body).Decode(&body); err != nil {
+				t.Fatalf("decode response: %v", err)
+			}
+			got := make([]string, len(body.Transactions))
+			for i := range body.Transactions {
+				got[i] = body.Transactions[i].ID
+			}
+			if strings.Join(got, ",") != strings.Join(tt.want, ",") {
+				t.Errorf("expected %v, got %v", tt.want, got)
+			}
+		})
+	}
+}
@@ -18,6 +18,7 @@ import (
 type AgentClient struct {
 	httpClient *http.Client
 	baseURL    string
+	invokeURL  string // montada uma vez no construtor
 	cb         *gobreaker.CircuitBreaker
 	cfg        resilience.Config
 }
@@ -27,6 +28,7 @@ func NewAgentClient(httpClient *http.Client, baseURL string, cb *gobreaker.Circu
 	return &AgentClient{
 		httpClient: httpClient,
 		baseURL:    baseURL,
+		invokeURL:  baseURL + "/v1/agent/invoke",
 		cb:         cb,
 		cfg:        cfg,
 	}
@@ -38,18 +40,18 @@ func (c *AgentClient) Call(ctx context.Context, req *domain.AgentRequest) (*doma
 	defer span.End()
 	span.SetAttributes(attribute.String("customer.id", req.CustomerID))
 
+	// O payload não muda entre tentativas — serializa uma única vez.
+	body, err := json.Marshal(req)
+	if err != nil {
+		return nil, err
+	}
+
 	var agentResp domain.AgentResponse
 
 	result, err := c.cb.Execute(func() (any, error) {
 		var innerErr error
 		innerErr = resilience.RetryWithBackoff(ctx, c.cfg, func() error {
-			body, err := json.Marshal(req)
-			if err != nil {
-				return err
-			}
-
-			url := fmt.Sprintf("%s/v1/agent/invoke", c.baseURL)
-			httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(body))
+			httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, c.invokeURL, bytes.NewReader(body))
 			if err != nil {
 				return err
 			}
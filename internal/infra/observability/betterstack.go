@@ -168,15 +168,15 @@ func (c *betterstackCore) Write(entry zapcore.Entry, fields []zapcore.Field) err
 
 	c.shared.mu.Lock()
 	c.shared.buffer = append(c.shared.buffer, logEntry)
-	bufLen := len(c.shared.buffer)
-	shouldFlush := bufLen >= c.maxBatchSize
+	shouldFlush := len(c.shared.buffer) >= c.maxBatchSize
 	c.shared.mu.Unlock()
 
-	// Flush imediato em 3 cenários:
+	// Flush imediato em 2 cenários:
 	// 1. Buffer atingiu maxBatchSize (batch cheio)
 	// 2. Log de nível Error ou superior (queremos visibilidade imediata)
-	// 3. Poucos itens acumulados (< 10) — não vale esperar 5s
-	if shouldFlush || entry.Level >= zapcore.ErrorLevel || bufLen <= 10 {
+	// O resto sai pelo ticker em batch. (Antes também havia flush com < 10
+	// itens — como cada flush esvazia o buffer, isso virava um POST por linha.)
+	if shouldFlush || entry.Level >= zapcore.ErrorLevel {
 		go c.flush()
 	}
 
@@ -203,10 +203,9 @@ func (c *betterstackCore) flush() {
 		c.shared.mu.Unlock()
 		return
 	}
-	// Copia e limpa o buffer
-	batch := make([]map[string]interface{}, len(c.shared.buffer))
-	copy(batch, c.shared.buffer)
-	c.shared.buffer = c.shared.buffer[:0]
+	// Troca o buffer por um novo (sem copiar o batch)
+	batch := c.shared.buffer
+	c.shared.buffer = make([]map[string]interface{}, 0, c.maxBatchSize)
 	c.shared.mu.Unlock()
 
 	// Serializa como JSON array
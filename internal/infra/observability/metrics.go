@@ -21,6 +21,15 @@ type Metrics struct {
 	cacheMisses     *prometheus.CounterVec
 	tokensUsed      *prometheus.CounterVec
 	requestsTotal   *prometheus.CounterVec
+
+	// Pre-bound children for the fixed label values used on the hot path and
+	// by GetAgentSnapshot, so they skip the WithLabelValues hash + lookup.
+	promptTokens       prometheus.Counter
+	completionTokens   prometheus.Counter
+	requestsSuccess    prometheus.Counter
+	requestsError      prometheus.Counter
+	profileCacheHits   prometheus.Counter
+	profileCacheMisses prometheus.Counter
 }
 
 // NewMetrics creates a dedicated Prometheus registry and registers all
@@ -30,7 +39,7 @@ func NewMetrics() *Metrics {
 	reg := prometheus.NewRegistry()
 	factory := promauto.With(reg)
 
-	return &Metrics{
+	m := &Metrics{
 		Registry: reg,
 
 		requestDuration: factory.NewHistogramVec(
@@ -77,6 +86,15 @@ func NewMetrics() *Metrics {
 			[]string{"status"},
 		),
 	}
+
+	m.promptTokens = m.tokensUsed.WithLabelValues("prompt")
+	m.completionTokens = m.tokensUsed.WithLabelValues("completion")
+	m.requestsSuccess = m.requestsTotal.WithLabelValues("success")
+	m.requestsError = m.requestsTotal.WithLabelValues("error")
+	m.profileCacheHits = m.cacheHits.WithLabelValues("profile")
+	m.profileCacheMisses = m.cacheMisses.WithLabelValues("profile")
+
+	return m
 }
 
 // RecordRequestDuration records the duration of an operation.
@@ -91,23 +109,38 @@ func (m *Metrics) IncrExternalError(service string) {
 
 // IncrCacheHit increments the cache hit counter.
 func (m *Metrics) IncrCacheHit(cache string) {
+	if cache == "profile" {
+		m.profileCacheHits.Inc()
+		return
+	}
 	m.cacheHits.WithLabelValues(cache).Inc()
 }
 
 // IncrCacheMiss increments the cache miss counter.
 func (m *Metrics) IncrCacheMiss(cache string) {
+	if cache == "profile" {
+		m.profileCacheMisses.Inc()
+		return
+	}
 	m.cacheMisses.WithLabelValues(cache).Inc()
 }
 
 // RecordTokens records prompt and completion token usage.
 func (m *Metrics) RecordTokens(prompt, completion int) {
-	m.tokensUsed.WithLabelValues("prompt").Add(float64(prompt))
-	m.tokensUsed.WithLabelValues("completion").Add(float64(completion))
+	m.promptTokens.Add(float64(prompt))
+	m.completionTokens.Add(float64(completion))
 }
 
 // IncrRequest increments the request counter with a status label.
 func (m *Metrics) IncrRequest(status string) {
-	m.requestsTotal.WithLabelValues(status).Inc()
+	switch status {
+	case "success":
+		m.requestsSuccess.Inc()
+	case "error":
+		m.requestsError.Inc()
+	default:
+		m.requestsTotal.WithLabelValues(status).Inc()
+	}
 }
 
 // GetAgentSnapshot returns a snapshot of agent-related metrics suitable for the
@@ -115,13 +148,12 @@ func (m *Metrics) IncrRequest(status string) {
 func (m *Metrics) GetAgentSnapshot() *domain.AgentMetrics {
 	// Gather current values from Prometheus counters.
 	// Note: Prometheus counters expose cumulative values.
-	promptTokens := getCounterValue(m.tokensUsed, "prompt")
-	completionTokens := getCounterValue(m.tokensUsed, "completion")
-	totalRequests := getCounterValue(m.requestsTotal, "success") +
-		getCounterValue(m.requestsTotal, "error")
-	errorCount := getCounterValue(m.requestsTotal, "error")
-	cacheHits := getCounterValue(m.cacheHits, "profile")
-	cacheMisses := getCounterValue(m.cacheMisses, "profile")
+	promptTokens := counterValue(m.promptTokens)
+	completionTokens := counterValue(m.completionTokens)
+	errorCount := counterValue(m.requestsError)
+	totalRequests := counterValue(m.requestsSuccess) + errorCount
+	cacheHits := counterValue(m.profileCacheHits)
+	cacheMisses := counterValue(m.profileCacheMisses)
 
 	totalTokens := promptTokens + completionTokens
 	avgTokens := float64(0)
@@ -154,11 +186,10 @@ func (m *Metrics) GetAgentSnapshot() *domain.AgentMetrics {
 	}
 }
 
-// getCounterValue extracts the current float64 value from a CounterVec for a given label.
-func getCounterValue(cv *prometheus.CounterVec, label string) float64 {
-	counter := cv.WithLabelValues(label)
+// counterValue extracts the current float64 value from a counter.
+func counterValue(counter prometheus.Counter) float64 {
 	m := &dto.Metric{}
-	if err := counter.(prometheus.Metric).Write(m); err != nil {
+	if err := counter.Write(m); err != nil {
 		return 0
 	}
 	if m.Counter != nil && m.Counter.Value != nil {
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"net/http"
+	"sort"
 	"time"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
@@ -20,7 +21,7 @@ func (c *Client) GetTransactionSummary(ctx context.Context, customerID string) (
 	ctx, span := tracer.Start(ctx, "Supabase.GetTransactionSummary")
 	defer span.End()
 
-	path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&order=date.desc", customerID)
+	path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&select=%s&order=date.desc", customerID, transactionColumns)
 	body, err := c.doRequest(ctx, http.MethodGet, path)
 	if err != nil {
 		return nil, err
@@ -33,7 +34,8 @@ func (c *Client) GetTransactionSummary(ctx context.Context, customerID string) (
 
 	summary := &domain.TransactionSummary{Count: len(txns)}
 	categoryTotals := make(map[string]float64)
-	for _, t := range txns {
+	for i := range txns {
+		t := &txns[i]
 		if t.Amount >= 0 {
 			summary.TotalCredits += t.Amount
 		} else {
@@ -52,13 +54,9 @@ func (c *Client) GetTransactionSummary(ctx context.Context, customerID string) (
 		topCats = append(topCats, domain.CategoryTotal{Category: cat, Total: total})
 	}
 	// Sort by total descending
-	for i := 0; i < len(topCats); i++ {
-		for j := i + 1; j < len(topCats); j++ {
-			if topCats[i].Total < topCats[j].Total {
-				topCats[i], topCats[j] = topCats[j], topCats[i]
-			}
-		}
-	}
+	sort.Slice(topCats, func(i, j int) bool {
+		return topCats[i].Total > topCats[j].Total
+	})
 	summary.TopCategories = topCats
 
 	if len(txns) > 0 {
@@ -80,13 +78,42 @@ func (c *Client) InsertTransaction(ctx context.Context, data map[string]any) err
 	return err
 }
 
+// transactionInsertBatchSize caps how many rows go into a single PostgREST
+// bulk insert, keeping request bodies bounded.
+const transactionInsertBatchSize = 500
+
+// InsertTransactions inserts raw transaction records using PostgREST bulk
+// inserts (one JSON array per batch) instead of one request per row.
+func (c *Client) InsertTransactions(ctx context.Context, rows []map[string]any) error {
+	ctx, span := tracer.Start(ctx, "Supabase.InsertTransactions")
+	defer span.End()
+
+	for start := 0; start < len(rows); start += transactionInsertBatchSize {
+		end := start + transactionInsertBatchSize
+		if end > len(rows) {
+			end = len(rows)
+		}
+		if err := c.doPostMinimal(ctx, "customer_transactions", rows[start:end]); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
 // ListTransactions returns transactions for a customer within a date range.
 func (c *Client) ListTransactions(ctx context.Context, customerID string, from, to string) ([]domain.Transaction, error) {
+	return c.ListRecentTransactions(ctx, customerID, from, to, 1000)
+}
+
+// ListRecentTransactions returns at most limit transactions within a date range,
+// newest first. The limit is pushed down to PostgREST so callers that only need
+// the head of the statement don't decode the whole period.
+func (c *Client) ListRecentTransactions(ctx context.Context, customerID string, from, to string, limit int) ([]domain.Transaction, error) {
 	ctx, span := tracer.Start(ctx, "Supabase.ListTransactions")
 	defer span.End()
 
-	path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&date=gte.%s&date=lt.%s&order=date.desc&limit=1000",
-		customerID, from, to)
+	path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&select=%s&date=gte.%s&date=lt.%s&order=date.desc&limit=%d",
+		customerID, transactionColumns, from, to, limit)
 	body, err := c.doRequest(ctx, http.MethodGet, path)
 	if err != nil {
 		return nil, err
@@ -27,6 +27,8 @@ type Client struct {
 	baseURL        string
 	apiKey         string
 	serviceRoleKey string
+	restURL        string // baseURL + "/rest/v1/", built once
+	authHeader     string // "Bearer " + serviceRoleKey, built once
 	cb             *gobreaker.CircuitBreaker
 	cfg            resilience.Config
 	logger         *zap.Logger
@@ -39,6 +41,8 @@ func NewClient(httpClient *http.Client, baseURL, apiKey, serviceRoleKey string,
 		baseURL:        baseURL,
 		apiKey:         apiKey,
 		serviceRoleKey: serviceRoleKey,
+		restURL:        baseURL + "/rest/v1/",
+		authHeader:     "Bearer " + serviceRoleKey,
 		cb:             cb,
 		cfg:            cfg,
 		logger:         logger,
@@ -48,7 +52,7 @@ func NewClient(httpClient *http.Client, baseURL, apiKey, serviceRoleKey string,
 // doRequest executes an authenticated request to Supabase PostgREST.
 // Includes automatic retry (up to 2 retries) with exponential backoff for transient errors.
 func (c *Client) doRequest(ctx context.Context, method, path string) ([]byte, error) {
-	url := fmt.Sprintf("%s/rest/v1/%s", c.baseURL, path)
+	url := c.restURL + path
 
 	const maxRetries = 2
 	backoff := 200 * time.Millisecond
@@ -82,7 +86,7 @@ func (c *Client) doRequest(ctx context.Context, method, path string) ([]byte, er
 		}
 
 		req.Header.Set("apikey", c.apiKey)
-		req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+		req.Header.Set("Authorization", c.authHeader)
 		req.Header.Set("Content-Type", "application/json")
 		req.Header.Set("Prefer", "return=representation")
 
@@ -157,6 +161,14 @@ type supabaseProfile struct {
 	CreditScore    int     `json:"credit_score"`
 }
 
+// Column projections for the hot read paths. PostgREST returns every column
+// by default; selecting only what we decode keeps the payload (and the JSON
+// scan that skips unknown keys) proportional to what we actually use.
+const (
+	profileColumns     = "customer_id,name,document,segment,monthly_revenue,account_age_months,credit_score"
+	transactionColumns = "id,date,amount,type,category,description,counterparty"
+)
+
 // GetProfile fetches customer profile from Supabase.
 func (c *Client) GetProfile(ctx context.Context, customerID string) (*domain.CustomerProfile, error) {
 	ctx, span := tracer.Start(ctx, "Supabase.GetProfile")
@@ -167,7 +179,7 @@ func (c *Client) GetProfile(ctx context.Context, customerID string) (*domain.Cus
 
 	_, err := c.cb.Execute(func() (any, error) {
 		return nil, resilience.RetryWithBackoff(ctx, c.cfg, func() error {
-			path := fmt.Sprintf("customer_profiles?customer_id=eq.%s&limit=1", customerID)
+			path := fmt.Sprintf("customer_profiles?customer_id=eq.%s&select=%s&limit=1", customerID, profileColumns)
 			body, err := c.doRequest(ctx, http.MethodGet, path)
 			if err != nil {
 				return err
@@ -231,7 +243,7 @@ func (c *Client) GetTransactions(ctx context.Context, customerID string) ([]doma
 
 	_, err := c.cb.Execute(func() (any, error) {
 		return nil, resilience.RetryWithBackoff(ctx, c.cfg, func() error {
-			path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&order=date.desc&limit=500", customerID)
+			path := fmt.Sprintf("customer_transactions?customer_id=eq.%s&select=%s&order=date.desc&limit=500", customerID, transactionColumns)
 			body, err := c.doRequest(ctx, http.MethodGet, path)
 			if err != nil {
 				return err
@@ -247,13 +259,15 @@ func (c *Client) GetTransactions(ctx context.Context, customerID string) ([]doma
 				return fmt.Errorf("failed to decode transactions: %w", err)
 			}
 
-			transactions = make([]domain.Transaction, 0, len(rows))
-			for _, r := range rows {
+			// Fill by index: avoids copying each row and each Transaction value
+			transactions = make([]domain.Transaction, len(rows))
+			for i := range rows {
+				r := &rows[i]
 				t, _ := time.Parse(time.RFC3339, r.Date)
 				if t.IsZero() {
 					t, _ = time.Parse("2006-01-02", r.Date)
 				}
-				transactions = append(transactions, domain.Transaction{
+				transactions[i] = domain.Transaction{
 					ID:           r.ID,
 					Date:         t,
 					Amount:       r.Amount,
@@ -261,7 +275,7 @@ func (c *Client) GetTransactions(ctx context.Context, customerID string) ([]doma
 					Category:     r.Category,
 					Description:  r.Description,
 					Counterparty: r.Counterparty,
-				})
+				}
 			}
 			return nil
 		})
@@ -15,7 +15,7 @@ import (
  */
 
 func (c *Client) doPost(ctx context.Context, table string, data map[string]any) ([]byte, error) {
-	url := fmt.Sprintf("%s/rest/v1/%s", c.baseURL, table)
+	url := c.restURL + table
 	jsonBody, err := json.Marshal(data)
 	if err != nil {
 		return nil, err
@@ -27,7 +27,7 @@ func (c *Client) doPost(ctx context.Context, table string, data map[string]any)
 	}
 
 	req.Header.Set("apikey", c.apiKey)
-	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+	req.Header.Set("Authorization", c.authHeader)
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Prefer", "return=representation")
 
@@ -61,7 +61,7 @@ func (c *Client) doPost(ctx context.Context, table string, data map[string]any)
 }
 
 func (c *Client) doPatch(ctx context.Context, path string, data map[string]any) error {
-	url := fmt.Sprintf("%s/rest/v1/%s", c.baseURL, path)
+	url := c.restURL + path
 	jsonBody, err := json.Marshal(data)
 	if err != nil {
 		return err
@@ -73,7 +73,7 @@ func (c *Client) doPatch(ctx context.Context, path string, data map[string]any)
 	}
 
 	req.Header.Set("apikey", c.apiKey)
-	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+	req.Header.Set("Authorization", c.authHeader)
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Prefer", "return=minimal")
 
@@ -102,7 +102,7 @@ func (c *Client) doPatch(ctx context.Context, path string, data map[string]any)
 }
 
 func (c *Client) doDelete(ctx context.Context, path string) error {
-	url := fmt.Sprintf("%s/rest/v1/%s", c.baseURL, path)
+	url := c.restURL + path
 
 	req, err := http.NewRequestWithContext(ctx, http.MethodDelete, url, nil)
 	if err != nil {
@@ -110,7 +110,7 @@ func (c *Client) doDelete(ctx context.Context, path string) error {
 	}
 
 	req.Header.Set("apikey", c.apiKey)
-	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+	req.Header.Set("Authorization", c.authHeader)
 	req.Header.Set("Content-Type", "application/json")
 
 	resp, err := c.httpClient.Do(req)
@@ -148,7 +148,7 @@ func readBody(resp *http.Response) ([]byte, error) {
 // doPostAny é como doPost, mas aceita qualquer tipo (slice, struct, etc).
 // Retorna o body com Prefer: return=representation.
 func (c *Client) doPostAny(ctx context.Context, table string, data any) ([]byte, error) {
-	url := fmt.Sprintf("%s/rest/v1/%s", c.baseURL, table)
+	url := c.restURL + table
 	jsonBody, err := json.Marshal(data)
 	if err != nil {
 		return nil, err
@@ -160,7 +160,7 @@ func (c *Client) doPostAny(ctx context.Context, table string, data any) ([]byte,
 	}
 
 	req.Header.Set("apikey", c.apiKey)
-	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+	req.Header.Set("Authorization", c.authHeader)
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Prefer", "return=representation")
 
@@ -192,6 +192,49 @@ func (c *Client) doPostAny(ctx context.Context, table string, data any) ([]byte,
 	return body, nil
 }
 
+// doPostMinimal é como doPostAny, mas com Prefer: return=minimal — para inserts
+// cujo retorno não é usado (ex.: bulk insert), o PostgREST não devolve as linhas.
+func (c *Client) doPostMinimal(ctx context.Context, table string, data any) error {
+	url := c.restURL + table
+	jsonBody, err := json.Marshal(data)
+	if err != nil {
+		return err
+	}
+
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(jsonBody))
+	if err != nil {
+		return err
+	}
+
+	req.Header.Set("apikey", c.apiKey)
+	req.Header.Set("Authorization", c.authHeader)
+	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("Prefer", "return=minimal")
+
+	resp, err := c.httpClient.Do(req)
+	if err != nil {
+		c.logger.Error("supabase: POST request failed",
+			zap.String("table", table),
+			zap.Error(err),
+		)
+		return err
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
+		body, _ := readBody(resp)
+		c.logger.Warn("supabase: POST non-2xx",
+			zap.String("table", table),
+			zap.Int("status", resp.StatusCode),
+			zap.String("body", string(body)),
+		)
+		return fmt.Errorf("supabase POST %s returned %d: %s", table, resp.StatusCode, string(body))
+	}
+
+	c.logger.Debug("supabase: POST OK", zap.String("table", table), zap.Int("status", resp.StatusCode))
+	return nil
+}
+
 // extractIDFromResponse extrai o campo "id" do primeiro elemento de um array JSON
 // retornado pelo PostgREST com Prefer: return=representation.
 func extractIDFromResponse(body []byte) (string, error) {
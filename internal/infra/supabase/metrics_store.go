@@ -83,7 +83,7 @@ func (c *Client) GetChatMetrics(ctx context.Context) (*ChatMetricsRow, error) {
 
 // doRPC chama uma função PostgreSQL via PostgREST RPC (POST /rest/v1/rpc/{function}).
 func (c *Client) doRPC(ctx context.Context, functionName string) ([]byte, error) {
-	url := fmt.Sprintf("%s/rest/v1/rpc/%s", c.baseURL, functionName)
+	url := c.restURL + "rpc/" + functionName
 
 	req, err := http.NewRequestWithContext(ctx, http.MethodPost, url, nil)
 	if err != nil {
@@ -91,7 +91,7 @@ func (c *Client) doRPC(ctx context.Context, functionName string) ([]byte, error)
 	}
 
 	req.Header.Set("apikey", c.apiKey)
-	req.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.serviceRoleKey))
+	req.Header.Set("Authorization", c.authHeader)
 	req.Header.Set("Content-Type", "application/json")
 
 	resp, err := c.httpClient.Do(req)
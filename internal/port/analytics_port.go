@@ -32,5 +32,7 @@ type AnalyticsStore interface {
 	// Transaction History
 	GetTransactionSummary(ctx context.Context, customerID string) (*domain.TransactionSummary, error)
 	ListTransactions(ctx context.Context, customerID string, from, to string) ([]domain.Transaction, error)
+	ListRecentTransactions(ctx context.Context, customerID string, from, to string, limit int) ([]domain.Transaction, error)
 	InsertTransaction(ctx context.Context, data map[string]any) error
+	InsertTransactions(ctx context.Context, rows []map[string]any) error
 }
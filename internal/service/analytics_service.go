@@ -2,6 +2,7 @@ package service
 
 import (
 	"context"
+	"sort"
 	"time"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
@@ -182,31 +183,48 @@ func (s *BankingService) GetFinancialSummary(ctx context.Context, customerID, pe
 
 	// Compute income, expenses, and category breakdown from real transactions
 	var totalIncome, totalExpenses float64
-	categoryMap := make(map[string]struct {
+	// Pointer accumulators: one map lookup per transaction instead of a
+	// read + write-back of a struct copy.
+	type categoryAcc struct {
 		Total float64
 		Count int
-	})
-
-	// Monthly breakdown for trend
-	monthlyIncome := make(map[string]float64)
-	monthlyExpenses := make(map[string]float64)
+	}
+	categoryMap := make(map[string]*categoryAcc)
 
-	for _, tx := range txns {
-		monthKey := tx.Date.Format("2006-01")
+	// Monthly breakdown for trend — one accumulator per month, filled in the same pass.
+	// Keyed by (year, month) so we only format the label once per month, not per transaction.
+	type monthKey struct {
+		year  int
+		month time.Month
+	}
+	monthly := make(map[monthKey]*domain.MonthlyTrend)
+
+	for i := range txns {
+		tx := &txns[i]
+		y, m, _ := tx.Date.Date()
+		mk := monthKey{y, m}
+		trend, ok := monthly[mk]
+		if !ok {
+			trend = &domain.MonthlyTrend{Month: tx.Date.Format("2006-01")}
+			monthly[mk] = trend
+		}
 		if tx.Amount >= 0 {
 			totalIncome += tx.Amount
-			monthlyIncome[monthKey] += tx.Amount
+			trend.Income += tx.Amount
 		} else {
 			totalExpenses += -tx.Amount // store as positive for display
-			monthlyExpenses[monthKey] += -tx.Amount
+			trend.Expenses += -tx.Amount
 		}
 		if tx.Category != "" {
-			entry := categoryMap[tx.Category]
+			entry, ok := categoryMap[tx.Category]
+			if !ok {
+				entry = &categoryAcc{}
+				categoryMap[tx.Category] = entry
+			}
 			entry.Total += -tx.Amount // positive value for expense categories
 			if tx.Amount < 0 {
 				entry.Count++
 			}
-			categoryMap[tx.Category] = entry
 		}
 	}
 
@@ -229,34 +247,22 @@ func (s *BankingService) GetFinancialSummary(ctx context.Context, customerID, pe
 		})
 	}
 
+	// Largest spending first (map iteration order is random)
+	sort.Slice(topCategories, func(i, j int) bool {
+		return topCategories[i].Amount > topCategories[j].Amount
+	})
+
 	// Build monthly trend
-	monthlyTrend := make([]domain.MonthlyTrend, 0)
-	monthSet := make(map[string]bool)
-	for m := range monthlyIncome {
-		monthSet[m] = true
-	}
-	for m := range monthlyExpenses {
-		monthSet[m] = true
-	}
-	for m := range monthSet {
-		inc := monthlyIncome[m]
-		exp := monthlyExpenses[m]
-		monthlyTrend = append(monthlyTrend, domain.MonthlyTrend{
-			Month:    m,
-			Income:   inc,
-			Expenses: exp,
-			Balance:  inc - exp,
-		})
+	monthlyTrend := make([]domain.MonthlyTrend, 0, len(monthly))
+	for _, trend := range monthly {
+		trend.Balance = trend.Income - trend.Expenses
+		monthlyTrend = append(monthlyTrend, *trend)
 	}
 
-	// Sort monthly trend by month ascending
-	for i := 0; i < len(monthlyTrend); i++ {
-		for j := i + 1; j < len(monthlyTrend); j++ {
-			if monthlyTrend[i].Month > monthlyTrend[j].Month {
-				monthlyTrend[i], monthlyTrend[j] = monthlyTrend[j], monthlyTrend[i]
-			}
-		}
-	}
+	// Sort monthly trend by month ascending ("2006-01" sorts lexicographically)
+	sort.Slice(monthlyTrend, func(i, j int) bool {
+		return monthlyTrend[i].Month < monthlyTrend[j].Month
+	})
 
 	netCashFlow := totalIncome - totalExpenses
 	avgDaily := float64(0)
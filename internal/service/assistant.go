@@ -13,10 +13,15 @@ import (
 	"go.opentelemetry.io/otel/attribute"
 	"go.uber.org/zap"
 	"golang.org/x/sync/errgroup"
+	"golang.org/x/sync/singleflight"
 )
 
 var tracer = otel.Tracer("service/assistant")
 
+// profileFetchTimeout bounds a shared (singleflight) profile fetch, which does
+// not inherit the cancellation of the caller that started it.
+const profileFetchTimeout = 10 * time.Second
+
 // Assistant orchestrates calls to Profile, Transactions and Agent APIs.
 type Assistant struct {
 	profileClient      port.ProfileFetcher
@@ -25,6 +30,10 @@ type Assistant struct {
 	cache              port.Cache[any]
 	metrics            *observability.Metrics
 	logger             *zap.Logger
+
+	// profileFlight coalesces concurrent cache misses for the same customer
+	// into a single upstream profile fetch.
+	profileFlight singleflight.Group
 }
 
 // NewAssistant creates the assistant service with all dependencies injected.
@@ -60,14 +69,43 @@ func (a *Assistant) GetProfile(ctx context.Context, customerID string) (*domain.
 	}
 	a.metrics.IncrCacheMiss("profile")
 
-	p, err := a.profileClient.GetProfile(ctx, customerID)
+	p, err := a.fetchProfile(ctx, cacheKey, customerID)
 	if err != nil {
 		return nil, fmt.Errorf("profile fetch: %w", err)
 	}
-	a.cache.Set(cacheKey, p)
 	return p, nil
 }
 
+// fetchProfile loads the profile from upstream and stores it in the cache.
+// Concurrent callers missing the cache for the same key share one in-flight request.
+// The shared request is detached from the first caller's cancellation (bounded by
+// profileFetchTimeout instead), so one caller giving up neither fails the others
+// nor counts as a failure against the profile circuit breaker; each caller still
+// stops waiting as soon as its own ctx is done.
+func (a *Assistant) fetchProfile(ctx context.Context, cacheKey, customerID string) (*domain.CustomerProfile, error) {
+	ch := a.profileFlight.DoChan(cacheKey, func() (any, error) {
+		fetchCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), profileFetchTimeout)
+		defer cancel()
+
+		p, err := a.profileClient.GetProfile(fetchCtx, customerID)
+		if err != nil {
+			return nil, err
+		}
+		a.cache.Set(cacheKey, p)
+		return p, nil
+	})
+
+	select {
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	case res := <-ch:
+		if res.Err != nil {
+			return nil, res.Err
+		}
+		return res.Val.(*domain.CustomerProfile), nil
+	}
+}
+
 // GetTransactions fetches the customer transactions (used by the dedicated /transactions route).
 func (a *Assistant) GetTransactions(ctx context.Context, customerID string) ([]domain.Transaction, error) {
 	ctx, span := tracer.Start(ctx, "Assistant.GetTransactions")
@@ -113,7 +151,7 @@ func (a *Assistant) GetAssistantResponse(ctx context.Context, customerID string,
 		}
 		a.metrics.IncrCacheMiss("profile")
 
-		p, err := a.profileClient.GetProfile(gCtx, customerID)
+		p, err := a.fetchProfile(gCtx, cacheKey, customerID)
 		if err != nil {
 			a.logger.Error("failed to fetch profile",
 				zap.String("customer_id", customerID),
@@ -123,7 +161,6 @@ func (a *Assistant) GetAssistantResponse(ctx context.Context, customerID string,
 			return fmt.Errorf("profile fetch: %w", err)
 		}
 		profile = p
-		a.cache.Set(cacheKey, p)
 		return nil
 	})
 
@@ -3,6 +3,8 @@ package service_test
 import (
 	"context"
 	"errors"
+	"sync"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -156,3 +158,71 @@ func TestGetAssistantResponse_ContextCancelled(t *testing.T) {
 		t.Fatal("expected error for cancelled context, got nil")
 	}
 }
+
+// blockingProfileClient holds GetProfile until release is closed and reports
+// the error of the ctx it was called with, so a cancelled shared fetch shows up.
+type blockingProfileClient struct {
+	started chan struct{}
+	release chan struct{}
+	calls   atomic.Int32
+}
+
+func (m *blockingProfileClient) GetProfile(ctx context.Context, customerID string) (*domain.CustomerProfile, error) {
+	if m.calls.Add(1) == 1 {
+		close(m.started)
+	}
+	<-m.release
+	if err := ctx.Err(); err != nil {
+		return nil, err
+	}
+	return &domain.CustomerProfile{CustomerID: customerID}, nil
+}
+
+func TestGetProfile_CancelledCallerDoesNotCancelSharedFetch(t *testing.T) {
+	client := &blockingProfileClient{started: make(chan struct{}), release: make(chan struct{})}
+	svc := service.NewAssistant(
+		client,
+		&mockTransactionsClient{},
+		&mockAgentClient{},
+		cache.New[any](5*time.Minute),
+		observability.NewMetrics(),
+		zap.NewNop(),
+	)
+
+	ctxA, cancelA := context.WithCancel(context.Background())
+	errA := make(chan error, 1)
+	go func() {
+		_, err := svc.GetProfile(ctxA, "cust-123")
+		errA <- err
+	}()
+	<-client.started
+
+	var (
+		wg   sync.WaitGroup
+		errB error
+		gotB *domain.CustomerProfile
+	)
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		gotB, errB = svc.GetProfile(context.Background(), "cust-123")
+	}()
+	time.Sleep(20 * time.Millisecond) // let B join the in-flight fetch
+
+	cancelA()
+	if err := <-errA; !errors.Is(err, context.Canceled) {
+		t.Fatalf("cancelled caller: expected context.Canceled, got %v", err)
+	}
+
+	close(client.release)
+	wg.Wait()
+	if errB != nil {
+		t.Fatalf("coalesced caller: expected no error, got %v", errB)
+	}
+	if gotB.CustomerID != "cust-123" {
+		t.Errorf("expected customer_id 'cust-123', got '%s'", gotB.CustomerID)
+	}
+	if n := client.calls.Load(); n != 1 {
+		t.Errorf("expected 1 upstream call, got %d", n)
+	}
+}
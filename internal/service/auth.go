@@ -9,11 +9,11 @@
 package service
 
 import (
-	"strings"
 	"time"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/port"
 
+	"github.com/golang-jwt/jwt/v5"
 	"go.opentelemetry.io/otel"
 	"go.uber.org/zap"
 )
@@ -34,27 +34,34 @@ type AuthService struct {
 	refreshTTL time.Duration
 	devAuth    bool
 	logger     *zap.Logger
+
+	// Built once in NewAuthService — every authenticated request validates a
+	// token, so the parser options and key func are not rebuilt per call.
+	jwtParser *jwt.Parser
+	jwtKey    jwt.Keyfunc
 }
 
 // NewAuthService creates a new auth service.
 func NewAuthService(store port.AuthStore, jwtSecret string, accessTTL, refreshTTL time.Duration, devAuth bool, logger *zap.Logger) *AuthService {
+	secret := []byte(jwtSecret)
 	return &AuthService{
 		store:      store,
-		jwtSecret:  []byte(jwtSecret),
+		jwtSecret:  secret,
 		accessTTL:  accessTTL,
 		refreshTTL: refreshTTL,
 		devAuth:    devAuth,
 		logger:     logger,
+		// Only HMAC algorithms are accepted, as before.
+		jwtParser: jwt.NewParser(jwt.WithValidMethods([]string{
+			jwt.SigningMethodHS256.Alg(),
+			jwt.SigningMethodHS384.Alg(),
+			jwt.SigningMethodHS512.Alg(),
+		})),
+		jwtKey: func(*jwt.Token) (any, error) { return secret, nil },
 	}
 }
 
 // normalizeDoc removes all non-digit characters from a document number (CPF/CNPJ).
 func normalizeDoc(s string) string {
-	var b strings.Builder
-	for _, r := range s {
-		if r >= '0' && r <= '9' {
-			b.WriteRune(r)
-		}
-	}
-	return b.String()
+	return keepDigits(s)
 }
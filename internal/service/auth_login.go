@@ -111,12 +111,19 @@ func (s *AuthService) Login(ctx context.Context, req *domain.LoginRequest) (*dom
 		}
 	}
 
-	// Reset failed attempts on successful login
-	_ = s.store.UpdateCredentials(ctx, profile.CustomerID, map[string]any{
-		"failed_attempts": 0,
-		"locked_until":    nil,
-		"last_login_at":   time.Now().Format(time.RFC3339),
-	})
+	// Reset failed attempts on successful login. The result is ignored, so the
+	// write overlaps with token signing and the refresh-token insert instead of
+	// adding a serial round-trip; the deferred wait keeps it inside the request.
+	resetDone := make(chan struct{})
+	go func() {
+		defer close(resetDone)
+		_ = s.store.UpdateCredentials(ctx, profile.CustomerID, map[string]any{
+			"failed_attempts": 0,
+			"locked_until":    nil,
+			"last_login_at":   time.Now().Format(time.RFC3339),
+		})
+	}()
+	defer func() { <-resetDone }()
 
 	// Generate tokens
 	accessToken, err := s.signAccessToken(profile.CustomerID, profile.Document)
@@ -0,0 +1,22 @@
+package service
+
+import "testing"
+
+func TestNormalizeDoc(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{"123.456.789-09", "12345678909"},
+		{"12.345.678/0001-90", "12345678000190"},
+		{" 12.345.678/0001-90 ", "12345678000190"},
+		{"12345678909", "12345678909"},
+		{"", ""},
+		{"abc", ""},
+	}
+	for _, tt := range tests {
+		if got := normalizeDoc(tt.in); got != tt.want {
+			t.Errorf("normalizeDoc(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
@@ -115,12 +115,7 @@ type JWTClaims struct {
 }
 
 func (s *AuthService) ValidateAccessToken(tokenString string) (*JWTClaims, error) {
-	token, err := jwt.ParseWithClaims(tokenString, &JWTClaims{}, func(t *jwt.Token) (any, error) {
-		if _, ok := t.Method.(*jwt.SigningMethodHMAC); !ok {
-			return nil, fmt.Errorf("unexpected signing method: %v", t.Header["alg"])
-		}
-		return s.jwtSecret, nil
-	})
+	token, err := s.jwtParser.ParseWithClaims(tokenString, &JWTClaims{}, s.jwtKey)
 	if err != nil {
 		return nil, &domain.ErrUnauthorized{Message: "Token inválido ou expirado"}
 	}
@@ -3,7 +3,6 @@ package service
 import (
 	"context"
 	"fmt"
-	"regexp"
 	"strconv"
 	"strings"
 	"time"
@@ -18,8 +17,6 @@ import (
  * Bill Payments
  */
 
-var digitOnlyRegex = regexp.MustCompile(`[^0-9]`)
-
 // ValidateBarcode validates a barcode or digitable line.
 func (s *BankingService) ValidateBarcode(ctx context.Context, req *domain.BarcodeValidationRequest) (*domain.BarcodeValidationResponse, error) {
 	ctx, span := bankTracer.Start(ctx, "BankingService.ValidateBarcode")
@@ -37,7 +34,7 @@ func (s *BankingService) ValidateBarcode(ctx context.Context, req *domain.Barcod
 	}
 
 	// Clean: keep only digits
-	clean := digitOnlyRegex.ReplaceAllString(input, "")
+	clean := keepDigits(input)
 
 	switch len(clean) {
 	case 47:
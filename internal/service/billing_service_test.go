@@ -0,0 +1,57 @@
+package service
+
+import (
+	"context"
+	"errors"
+	"testing"
+
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
+)
+
+func TestValidateBarcode_NormalizesDigitableLine(t *testing.T) {
+	const clean = "23793381286000000000300000000400184340000012345"
+	tests := []struct {
+		name  string
+		input string
+	}{
+		{"formatted with dots and spaces", "23793.38128 60000.000003 00000.000400 1 84340000012345"},
+		{"already clean", clean},
+	}
+	svc := &BankingService{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			resp, err := svc.ValidateBarcode(context.Background(), &domain.BarcodeValidationRequest{DigitableLine: tt.input})
+			if err != nil {
+				t.Fatalf("expected no error, got %v", err)
+			}
+			if !resp.IsValid || resp.BillType != "bank_slip" {
+				t.Fatalf("expected valid bank_slip, got %+v", resp)
+			}
+			if resp.DigitableLine != clean {
+				t.Errorf("expected digitable line %q, got %q", clean, resp.DigitableLine)
+			}
+			if resp.BankCode != "237" || resp.Amount != 123.45 {
+				t.Errorf("expected bank 237 and amount 123.45, got %s / %v", resp.BankCode, resp.Amount)
+			}
+		})
+	}
+}
+
+func TestValidateBarcode_EmptyInput(t *testing.T) {
+	svc := &BankingService{}
+
+	_, err := svc.ValidateBarcode(context.Background(), &domain.BarcodeValidationRequest{})
+	var validation *domain.ErrValidation
+	if !errors.As(err, &validation) {
+		t.Fatalf("expected validation error for empty input, got %v", err)
+	}
+
+	// Só separadores: não sobra nenhum dígito depois da limpeza
+	resp, err := svc.ValidateBarcode(context.Background(), &domain.BarcodeValidationRequest{DigitableLine: " . . "})
+	if err != nil {
+		t.Fatalf("expected no error, got %v", err)
+	}
+	if resp.IsValid {
+		t.Error("expected input without digits to be invalid")
+	}
+}
@@ -396,11 +396,20 @@ func (s *BankingService) GetCardInvoiceByMonth(ctx context.Context, customerID,
 
 // sumTransactionsForMonth returns the total amount of transactions
 // whose transaction_date falls in the given month (format "2006-01").
+// The month is parsed once and compared as (year, month) integers, rather than
+// formatting every transaction date into a fresh string for the comparison.
 func sumTransactionsForMonth(txns []domain.CreditCardTransaction, month string) float64 {
+	ref, err := time.Parse("2006-01", month)
+	if err != nil {
+		return 0 // an unparseable month never matched any formatted date
+	}
+	refYear, refMonth := ref.Year(), ref.Month()
+
 	var total float64
-	for _, t := range txns {
-		if t.TransactionDate.Format("2006-01") == month {
-			total += t.Amount
+	for i := range txns {
+		y, m, _ := txns[i].TransactionDate.Date()
+		if y == refYear && m == refMonth {
+			total += txns[i].Amount
 		}
 	}
 	return total
@@ -0,0 +1,50 @@
+package service
+
+import (
+	"testing"
+	"time"
+
+	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
+)
+
+func TestSumTransactionsForMonth(t *testing.T) {
+	at := func(s string, amount float64) domain.CreditCardTransaction {
+		d, err := time.Parse(time.RFC3339, s)
+		if err != nil {
+			t.Fatal(err)
+		}
+		return domain.CreditCardTransaction{TransactionDate: d, Amount: amount}
+	}
+	txns := []domain.CreditCardTransaction{
+		at("2023-03-10T12:00:00Z", 1),  // mesmo mês, outro ano
+		at("2024-03-01T00:00:00Z", 10), // primeiro instante do mês
+		at("2024-03-15T12:00:00Z", 20),
+		at("2024-03-31T23:59:59Z", 40),   // último instante do mês
+		at("2024-04-01T00:00:00Z", 80),   // já é o mês seguinte
+		at("2023-12-31T23:59:59Z", 100),  // virada de ano: dezembro
+		at("2024-01-01T00:00:00Z", 1000), // virada de ano: janeiro
+	}
+
+	tests := []struct {
+		name  string
+		txns  []domain.CreditCardTransaction
+		month string
+		want  float64
+	}{
+		{"month boundaries, other year excluded", txns, "2024-03", 70},
+		{"same month in another year", txns, "2023-03", 1},
+		{"december before year boundary", txns, "2023-12", 100},
+		{"january after year boundary", txns, "2024-01", 1000},
+		{"month with no transactions", txns, "2024-05", 0},
+		{"empty slice", nil, "2024-03", 0},
+		{"unparseable month", txns, "2024-1", 0},
+		{"empty month", txns, "", 0},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := sumTransactionsForMonth(tt.txns, tt.month); got != tt.want {
+				t.Errorf("sumTransactionsForMonth(%q) = %v, want %v", tt.month, got, tt.want)
+			}
+		})
+	}
+}
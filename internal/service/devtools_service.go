@@ -10,12 +10,73 @@ import (
 
 	"github.com/google/uuid"
 	"go.uber.org/zap"
+	"golang.org/x/sync/errgroup"
 )
 
+// devInsertConcurrency bounds how many dev-tools inserts hit Supabase at once.
+const devInsertConcurrency = 8
+
 /*
  * Dev Tools
  */
 
+// Static catalogs used by the dev-tools generators. They are package-level so
+// they are allocated once instead of being rebuilt on every request.
+
+type devTxType struct {
+	Type         string
+	IsDebit      bool
+	Descs        []string
+	Counterparty []string
+	Category     string
+}
+
+var devTxTypes = []devTxType{
+	{"pix_sent", true, []string{"Pix enviado - Maria Silva", "Pix enviado - João LTDA", "Pix enviado - Ana Costa"}, []string{"Maria Silva", "João LTDA", "Ana Costa"}, "pix"},
+	{"pix_received", false, []string{"Pix recebido - Tech Corp", "Pix recebido - Vendas Online", "Pix recebido - Cliente ABC"}, []string{"Tech Corp", "Vendas Online", "Cliente ABC"}, "recebimento"},
+	{"debit_purchase", true, []string{"Supermercado Extra", "Posto Shell", "Farmácia São Paulo", "Restaurante Sabor"}, []string{"Supermercado Extra", "Posto Shell", "Farmácia São Paulo", "Restaurante Sabor"}, "compras"},
+	{"credit_purchase", true, []string{"Amazon AWS", "Google Cloud", "Material Escritório", "Uber Business"}, []string{"Amazon AWS", "Google Cloud", "Material Escritório", "Uber Business"}, "tecnologia"},
+	{"transfer_in", false, []string{"TED recebida - Fornecedor A", "DOC recebido - Partner B", "Transferência recebida - Cliente"}, []string{"Fornecedor A", "Partner B", "Cliente"}, "recebimento"},
+	{"transfer_out", true, []string{"TED enviada - Aluguel", "TED enviada - Fornecedor", "Transferência - Pagamento"}, []string{"Imobiliária", "Fornecedor", "Pagamento"}, "despesas"},
+	{"bill_payment", true, []string{"Conta de luz", "Conta de telefone", "Internet Fibra", "IPTU"}, []string{"CPFL Energia", "Vivo Telefonia", "Vivo Fibra", "Prefeitura Municipal"}, "contas"},
+	{"credit", false, []string{"Crédito recebido", "Estorno - Compra duplicada", "Bonificação empresarial"}, []string{"Banco Itaú", "Banco Itaú", "Banco Itaú"}, "credito"},
+	{"debit", true, []string{"Débito automático", "Tarifa bancária", "Cobrança serviço"}, []string{"Banco Itaú", "Banco Itaú", "Banco Itaú"}, "debito"},
+}
+
+type devCardMerchant struct {
+	Name        string
+	Category    string
+	Description string
+}
+
+// devCardMerchants is built once; descriptions are precomputed so each
+// generated purchase row only copies strings.
+var devCardMerchants = func() []devCardMerchant {
+	base := []devCardMerchant{
+		{Name: "Restaurante Sabor & Arte", Category: "food"},
+		{Name: "Posto Shell BR-101", Category: "fuel"},
+		{Name: "Amazon AWS", Category: "technology"},
+		{Name: "Uber Business", Category: "transport"},
+		{Name: "Netflix Assinatura", Category: "subscription"},
+		{Name: "Google Cloud Platform", Category: "technology"},
+		{Name: "iFood Corporativo", Category: "food"},
+		{Name: "Kalunga Papelaria", Category: "office_supplies"},
+		{Name: "99 Táxi Corporativo", Category: "transport"},
+		{Name: "Adobe Creative Cloud", Category: "subscription"},
+		{Name: "Hotel Ibis Business", Category: "travel"},
+		{Name: "Seguro Porto PJ", Category: "insurance"},
+		{Name: "Copel Energia", Category: "utilities"},
+		{Name: "Google Ads", Category: "marketing"},
+		{Name: "Contabilidade Express", Category: "professional_services"},
+		{Name: "DAS Simples Nacional", Category: "tax"},
+		{Name: "Limpeza & Manutenção", Category: "maintenance"},
+	}
+	for i := range base {
+		base[i].Description = "Compra - " + base[i].Name
+	}
+	return base
+}()
+
 // DevAddBalance adds the given amount to the customer's primary account balance.
 func (s *BankingService) DevAddBalance(ctx context.Context, req *domain.DevAddBalanceRequest) (*domain.DevAddBalanceResponse, error) {
 	ctx, span := bankTracer.Start(ctx, "BankingService.DevAddBalance")
@@ -155,34 +216,16 @@ func (s *BankingService) DevGenerateTransactions(ctx context.Context, req *domai
 	}
 	daysSpan := months * 30 // approximate days to spread transactions across
 
-	type txTypeInfo struct {
-		Type         string
-		IsDebit      bool
-		Descs        []string
-		Counterparty []string
-		Category     string
-	}
-	txTypes := []txTypeInfo{
-		{"pix_sent", true, []string{"Pix enviado - Maria Silva", "Pix enviado - João LTDA", "Pix enviado - Ana Costa"}, []string{"Maria Silva", "João LTDA", "Ana Costa"}, "pix"},
-		{"pix_received", false, []string{"Pix recebido - Tech Corp", "Pix recebido - Vendas Online", "Pix recebido - Cliente ABC"}, []string{"Tech Corp", "Vendas Online", "Cliente ABC"}, "recebimento"},
-		{"debit_purchase", true, []string{"Supermercado Extra", "Posto Shell", "Farmácia São Paulo", "Restaurante Sabor"}, []string{"Supermercado Extra", "Posto Shell", "Farmácia São Paulo", "Restaurante Sabor"}, "compras"},
-		{"credit_purchase", true, []string{"Amazon AWS", "Google Cloud", "Material Escritório", "Uber Business"}, []string{"Amazon AWS", "Google Cloud", "Material Escritório", "Uber Business"}, "tecnologia"},
-		{"transfer_in", false, []string{"TED recebida - Fornecedor A", "DOC recebido - Partner B", "Transferência recebida - Cliente"}, []string{"Fornecedor A", "Partner B", "Cliente"}, "recebimento"},
-		{"transfer_out", true, []string{"TED enviada - Aluguel", "TED enviada - Fornecedor", "Transferência - Pagamento"}, []string{"Imobiliária", "Fornecedor", "Pagamento"}, "despesas"},
-		{"bill_payment", true, []string{"Conta de luz", "Conta de telefone", "Internet Fibra", "IPTU"}, []string{"CPFL Energia", "Vivo Telefonia", "Vivo Fibra", "Prefeitura Municipal"}, "contas"},
-		{"credit", false, []string{"Crédito recebido", "Estorno - Compra duplicada", "Bonificação empresarial"}, []string{"Banco Itaú", "Banco Itaú", "Banco Itaú"}, "credito"},
-		{"debit", true, []string{"Débito automático", "Tarifa bancária", "Cobrança serviço"}, []string{"Banco Itaú", "Banco Itaú", "Banco Itaú"}, "debito"},
-	}
-
 	generated := 0
 	netImpact := 0.0
 	totalIncome := 0.0
 	totalExpenses := 0.0
 	now := time.Now()
-	var generatedTxns []domain.Transaction
+	rows := make([]map[string]any, 0, req.Count)
+	candidates := make([]domain.Transaction, 0, req.Count)
 
 	for i := 0; i < req.Count; i++ {
-		txInfo := txTypes[rand.Intn(len(txTypes))]
+		txInfo := devTxTypes[rand.Intn(len(devTxTypes))]
 		idx := rand.Intn(len(txInfo.Descs))
 		desc := txInfo.Descs[idx]
 		counterparty := txInfo.Counterparty[idx]
@@ -195,7 +238,7 @@ func (s *BankingService) DevGenerateTransactions(ctx context.Context, req *domai
 		}
 
 		txID := uuid.New().String()
-		tx := map[string]any{
+		rows = append(rows, map[string]any{
 			"id":           txID,
 			"customer_id":  req.CustomerID,
 			"date":         txDate.Format(time.RFC3339),
@@ -204,21 +247,8 @@ func (s *BankingService) DevGenerateTransactions(ctx context.Context, req *domai
 			"type":         txInfo.Type,
 			"category":     txInfo.Category,
 			"counterparty": counterparty,
-		}
-
-		if err := s.store.InsertTransaction(ctx, tx); err != nil {
-			s.logger.Warn("DEV: failed to insert transaction", zap.Int("index", i), zap.Error(err))
-			continue
-		}
-		generated++
-		netImpact += amount // amount is already negative for debits
-		if amount > 0 {
-			totalIncome += amount
-		} else {
-			totalExpenses += -amount // store as positive value
-		}
-
-		generatedTxns = append(generatedTxns, domain.Transaction{
+		})
+		candidates = append(candidates, domain.Transaction{
 			ID:           txID,
 			Date:         txDate,
 			Amount:       amount,
@@ -229,6 +259,28 @@ func (s *BankingService) DevGenerateTransactions(ctx context.Context, req *domai
 		})
 	}
 
+	// One multi-row insert instead of one POST per transaction. The batch is
+	// all-or-nothing, so totals only count rows that were actually persisted.
+	var generatedTxns []domain.Transaction
+	if err := s.store.InsertTransactions(ctx, rows); err != nil {
+		s.logger.Warn("DEV: failed to insert transactions",
+			zap.Int("count", len(rows)),
+			zap.Error(err),
+		)
+	} else {
+		generatedTxns = candidates
+		for i := range candidates {
+			amount := candidates[i].Amount
+			generated++
+			netImpact += amount // amount is already negative for debits
+			if amount > 0 {
+				totalIncome += amount
+			} else {
+				totalExpenses += -amount // store as positive value
+			}
+		}
+	}
+
 	// Always update the account balance so generated transactions are reflected
 	// in the real balance, bank statement, income and expenses consistently.
 	var newBalance float64
@@ -319,29 +371,6 @@ func (s *BankingService) DevAddCardPurchase(ctx context.Context, req *domain.Dev
 		return nil, &domain.ErrValidation{Field: "cardId", Message: "cartão não está ativo"}
 	}
 
-	merchants := []struct {
-		Name     string
-		Category string
-	}{
-		{"Restaurante Sabor & Arte", "food"},
-		{"Posto Shell BR-101", "fuel"},
-		{"Amazon AWS", "technology"},
-		{"Uber Business", "transport"},
-		{"Netflix Assinatura", "subscription"},
-		{"Google Cloud Platform", "technology"},
-		{"iFood Corporativo", "food"},
-		{"Kalunga Papelaria", "office_supplies"},
-		{"99 Táxi Corporativo", "transport"},
-		{"Adobe Creative Cloud", "subscription"},
-		{"Hotel Ibis Business", "travel"},
-		{"Seguro Porto PJ", "insurance"},
-		{"Copel Energia", "utilities"},
-		{"Google Ads", "marketing"},
-		{"Contabilidade Express", "professional_services"},
-		{"DAS Simples Nacional", "tax"},
-		{"Limpeza & Manutenção", "maintenance"},
-	}
-
 	now := time.Now()
 	generated := 0
 	var totalAmount float64
@@ -362,8 +391,9 @@ func (s *BankingService) DevAddCardPurchase(ctx context.Context, req *domain.Dev
 		monthEnd = now
 	}
 
-	for i := 0; i < req.Count; i++ {
-		m := merchants[rand.Intn(len(merchants))]
+	purchases := make([]map[string]any, req.Count)
+	for i := range purchases {
+		m := devCardMerchants[rand.Intn(len(devCardMerchants))]
 
 		var txDate time.Time
 		if req.Mode == "today" && req.TargetMonth == "" {
@@ -381,7 +411,7 @@ func (s *BankingService) DevAddCardPurchase(ctx context.Context, req *domain.Dev
 			txDate = txDate.Add(time.Duration(rand.Intn(60)) * time.Minute)
 		}
 
-		tx := map[string]any{
+		purchases[i] = map[string]any{
 			"id":                  uuid.New().String(),
 			"card_id":             req.CardID,
 			"customer_id":         req.CustomerID,
@@ -389,19 +419,36 @@ func (s *BankingService) DevAddCardPurchase(ctx context.Context, req *domain.Dev
 			"amount":              req.Amount,
 			"merchant_name":       m.Name,
 			"category":            m.Category,
-			"description":         fmt.Sprintf("Compra - %s", m.Name),
+			"description":         m.Description,
 			"installments":        1,
 			"current_installment": 1,
 			"transaction_type":    "purchase",
 			"status":              "confirmed",
 		}
+	}
+
+	// Inserts are independent round-trips to Supabase — run them concurrently
+	// (bounded) instead of paying up to 50 sequential latencies.
+	inserted := make([]bool, len(purchases))
+	var g errgroup.Group
+	g.SetLimit(devInsertConcurrency)
+	for i := range purchases {
+		g.Go(func() error {
+			if txErr := s.store.InsertCreditCardTransaction(ctx, purchases[i]); txErr != nil {
+				s.logger.Warn("DEV: failed to insert card purchase", zap.Int("index", i), zap.Error(txErr))
+				return nil
+			}
+			inserted[i] = true
+			return nil
+		})
+	}
+	_ = g.Wait()
 
-		if txErr := s.store.InsertCreditCardTransaction(ctx, tx); txErr != nil {
-			s.logger.Warn("DEV: failed to insert card purchase", zap.Int("index", i), zap.Error(txErr))
-			continue
+	for _, ok := range inserted {
+		if ok {
+			generated++
+			totalAmount += req.Amount
 		}
-		generated++
-		totalAmount += req.Amount
 	}
 
 	// Update card used_limit and available_limit
@@ -0,0 +1,25 @@
+package service
+
+/*
+ * Shared helper functions
+ */
+
+// keepDigits returns s with every character other than ASCII '0'-'9' removed.
+// Input that is already all digits is returned as is, without allocating.
+func keepDigits(s string) string {
+	i := 0
+	for i < len(s) && s[i] >= '0' && s[i] <= '9' {
+		i++
+	}
+	if i == len(s) {
+		return s
+	}
+	buf := make([]byte, i, len(s))
+	copy(buf, s[:i])
+	for ; i < len(s); i++ {
+		if c := s[i]; c >= '0' && c <= '9' {
+			buf = append(buf, c)
+		}
+	}
+	return string(buf)
+}
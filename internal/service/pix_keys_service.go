@@ -2,7 +2,6 @@ package service
 
 import (
 	"context"
-	"strings"
 	"time"
 
 	"github.com/boddenberg/pj-assistant-bfa-go/internal/domain"
@@ -44,43 +43,52 @@ func (s *BankingService) LookupPixKey(ctx context.Context, keyType, keyValue str
 }
 
 // detectPixKeyType infers the pix key type from the value format.
+// A single scan collects every feature the rules need (digit count, '@',
+// dashes, CNPJ punctuation); the rules then dispatch on those counters in
+// the same precedence as before, without re-scanning or building strings.
 func detectPixKeyType(value string) string {
-	// Strip non-digit chars for numeric checks
-	digits := ""
+	digitCount := 0
+	dashCount := 0
+	hasAt := false
 	hasCNPJFormatting := false
-	for _, r := range value {
-		if r >= '0' && r <= '9' {
-			digits += string(r)
-		}
-		if r == '.' || r == '/' {
+	for i := 0; i < len(value); i++ {
+		switch c := value[i]; {
+		case c >= '0' && c <= '9':
+			digitCount++
+		case c == '@':
+			hasAt = true
+		case c == '-':
+			dashCount++
+		case c == '.' || c == '/':
 			hasCNPJFormatting = true
 		}
 	}
+	hasPlusPrefix := len(value) > 0 && value[0] == '+'
 
 	// Email — check first since it's unambiguous
-	if strings.Contains(value, "@") {
+	if hasAt {
 		return "email"
 	}
 	// UUID-like → random
-	if len(value) == 36 && strings.Count(value, "-") == 4 {
+	if len(value) == 36 && dashCount == 4 {
 		return "random"
 	}
 	// CNPJ: 14 digits, or 11-14 digits with CNPJ formatting (dots/slashes)
-	if len(digits) == 14 {
+	if digitCount == 14 {
 		return "cnpj"
 	}
-	if hasCNPJFormatting && len(digits) >= 11 && len(digits) <= 14 {
+	if hasCNPJFormatting && digitCount >= 11 && digitCount <= 14 {
 		return "cnpj"
 	}
 	// CPF: 11 digits (not starting with +)
-	if len(digits) == 11 && !strings.HasPrefix(value, "+") {
+	if digitCount == 11 && !hasPlusPrefix {
 		return "cpf"
 	}
 	// Phone: starts with + or has 10-13 digits (only if no CNPJ formatting)
-	if strings.HasPrefix(value, "+") {
+	if hasPlusPrefix {
 		return "phone"
 	}
-	if len(digits) >= 10 && len(digits) <= 13 && !hasCNPJFormatting {
+	if digitCount >= 10 && digitCount <= 13 && !hasCNPJFormatting {
 		return "phone"
 	}
 	// Could not determine
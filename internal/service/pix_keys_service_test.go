@@ -0,0 +1,38 @@
+package service
+
+import "testing"
+
+// A ordem das regras importa: email > random (UUID) > CNPJ > CPF > telefone.
+func TestDetectPixKeyType(t *testing.T) {
+	tests := []struct {
+		name  string
+		value string
+		want  string
+	}{
+		{"email", "contato@empresa.com.br", "email"},
+		{"email wins over phone prefix", "+55contato@empresa.com", "email"},
+		{"uuid", "123e4567-e89b-12d3-a456-426614174000", "random"},
+		{"uuid wins over digit rules", "12345678-1234-1234-1234-123456789012", "random"},
+		{"cnpj formatted", "12.345.678/0001-90", "cnpj"},
+		{"cnpj bare", "12345678000190", "cnpj"},
+		{"dotted 11 digits is treated as cnpj", "123.456.789-09", "cnpj"},
+		{"cpf bare", "12345678909", "cpf"},
+		{"11 digits without plus is cpf, even phone-shaped", "(11) 98765-4321", "cpf"},
+		{"phone +55", "+5511987654321", "phone"},
+		{"phone +55 formatted", "+55 11 98765-4321", "phone"},
+		{"phone 10 digits", "1198765432", "phone"},
+		{"phone 12 digits", "551198765432", "phone"},
+		{"phone 13 digits", "5511987654321", "phone"},
+		{"too few digits", "123456789", ""},
+		{"too few formatted digits", "12.345.678", ""},
+		{"text", "minha chave", ""},
+		{"empty", "", ""},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := detectPixKeyType(tt.value); got != tt.want {
+				t.Errorf("detectPixKeyType(%q) = %q, want %q", tt.value, got, tt.want)
+			}
+		})
+	}
+}
@@ -0,0 +1,14 @@
+-- Migration: Replace the IVFFlat index on documents.embedding with HNSW
+--
+-- The IVFFlat index was created with lists = 10 in the init migration, usually
+-- before any document was loaded, so its centroids are meaningless and recall
+-- degrades as the knowledge base grows (each probe scans a badly-balanced list).
+-- HNSW needs no training step, stays accurate on incremental inserts and answers
+-- the match_documents ORDER BY embedding <=> query LIMIT k with a single graph
+-- search. Cosine ops keep the same distance used by match_documents.
+
+DROP INDEX IF EXISTS idx_documents_embedding;
+
+CREATE INDEX IF NOT EXISTS idx_documents_embedding_hnsw ON documents
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,13 @@
+-- Migration: Composite index for per-customer statement queries
+--
+-- ListRecentTransactions (extrato, resumo financeiro e contexto do chat) always
+-- filters customer_id = ? AND date in [from, to), ORDER BY date DESC LIMIT n.
+-- With separate single-column indexes Postgres picks one and sorts/filters the
+-- rest; (customer_id, date DESC) serves the filter, the order and the limit
+-- straight from the index, stopping after n rows.
+-- The old customer_id-only index is a prefix of the new one and is dropped.
+
+CREATE INDEX IF NOT EXISTS idx_customer_transactions_customer_date
+    ON customer_transactions (customer_id, date DESC);
+
+DROP INDEX IF EXISTS idx_customer_transactions_customer_id;